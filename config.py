@@ -8,12 +8,24 @@ SAFETY: Type-safe configuration with defaults
 
 import json
 import os
+import sys
 from pathlib import Path
 from typing import Dict, Any, Optional
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields
+from functools import lru_cache
 
+# Use orjson for faster JSON parsing/serialization when available
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
-@dataclass
+# Slotted dataclasses need Python 3.10+; older interpreters keep a per-instance __dict__
+_DATACLASS_OPTIONS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_DATACLASS_OPTIONS)
 class SimulationConfig:
     """Configuration for simulation parameters."""
     
@@ -51,7 +63,7 @@ class SimulationConfig:
             raise ValueError(f"Max file size must be positive, got {self.max_file_size_mb}")
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class SecurityConfig:
     """Security-related configuration."""
     
@@ -73,6 +85,11 @@ class SecurityConfig:
     })
 
 
+# Field names accepted from config files, computed once per dataclass
+_SIMULATION_FIELDS = frozenset(f.name for f in fields(SimulationConfig))
+_SECURITY_FIELDS = frozenset(f.name for f in fields(SecurityConfig))
+
+
 class ConfigManager:
     """Manages configuration loading and validation."""
     
@@ -87,8 +104,8 @@ class ConfigManager:
         # Load from file if it exists
         if Path(self.config_file).exists():
             try:
-                with open(self.config_file, 'r') as f:
-                    config_data = json.load(f)
+                raw = Path(self.config_file).read_bytes()
+                config_data = orjson.loads(raw) if ORJSON_AVAILABLE else json.loads(raw)
                 self._apply_config_data(config_data)
             except Exception as e:
                 print(f"Warning: Could not load config file: {e}")
@@ -102,35 +119,38 @@ class ConfigManager:
     def _apply_config_data(self, config_data: Dict[str, Any]) -> None:
         """Apply configuration data to config objects."""
         if "simulation" in config_data:
-            sim_data = config_data["simulation"]
-            for key, value in sim_data.items():
-                if hasattr(self.simulation_config, key):
-                    setattr(self.simulation_config, key, value)
+            sim_config = self.simulation_config
+            for key, value in config_data["simulation"].items():
+                if key in _SIMULATION_FIELDS:
+                    setattr(sim_config, key, value)
         
         if "security" in config_data:
-            sec_data = config_data["security"]
-            for key, value in sec_data.items():
-                if hasattr(self.security_config, key):
-                    setattr(self.security_config, key, value)
+            sec_config = self.security_config
+            for key, value in config_data["security"].items():
+                if key in _SECURITY_FIELDS:
+                    setattr(sec_config, key, value)
     
     def _load_from_environment(self) -> None:
         """Load configuration from environment variables."""
-        env_mappings = {
-            "FAKE_TRADING_VOLATILITY": ("simulation_config", "volatility", float),
-            "FAKE_TRADING_DURATION": ("simulation_config", "duration_seconds", int),
-            "FAKE_TRADING_DATA_FILE": ("simulation_config", "data_file", str),
-            "FAKE_TRADING_OUTPUT_FILE": ("simulation_config", "output_file", str),
-            "FAKE_TRADING_LOG_LEVEL": ("simulation_config", "log_level", str),
-        }
+        env_mappings = (
+            ("FAKE_TRADING_VOLATILITY", "simulation_config", "volatility", float),
+            ("FAKE_TRADING_DURATION", "simulation_config", "duration_seconds", int),
+            ("FAKE_TRADING_DATA_FILE", "simulation_config", "data_file", str),
+            ("FAKE_TRADING_OUTPUT_FILE", "simulation_config", "output_file", str),
+            ("FAKE_TRADING_LOG_LEVEL", "simulation_config", "log_level", str),
+        )
         
-        for env_var, (config_attr, key, type_cast) in env_mappings.items():
-            if env_var in os.environ:
-                try:
-                    value = type_cast(os.environ[env_var])
-                    config_obj = getattr(self, config_attr)
-                    setattr(config_obj, key, value)
-                except (ValueError, TypeError) as e:
-                    print(f"Warning: Invalid environment variable {env_var}: {e}")
+        get_env = os.environ.get
+        for env_var, config_attr, key, type_cast in env_mappings:
+            raw_value = get_env(env_var)
+            if raw_value is None:
+                continue
+            try:
+                value = type_cast(raw_value)
+                config_obj = getattr(self, config_attr)
+                setattr(config_obj, key, value)
+            except (ValueError, TypeError) as e:
+                print(f"Warning: Invalid environment variable {env_var}: {e}")
     
     def save_config(self, filename: Optional[str] = None) -> None:
         """Save current configuration to file."""
@@ -159,8 +179,12 @@ class ConfigManager:
         }
         
         try:
-            with open(filename, 'w') as f:
-                json.dump(config_data, f, indent=2)
+            if ORJSON_AVAILABLE:
+                with open(filename, 'wb') as f:
+                    f.write(orjson.dumps(config_data, option=orjson.OPT_INDENT_2))
+            else:
+                with open(filename, 'w') as f:
+                    json.dump(config_data, f, indent=2)
             print(f"Configuration saved to {filename}")
         except Exception as e:
             print(f"Error saving configuration: {e}")
@@ -179,31 +203,40 @@ class ConfigManager:
         print("=" * 50)
         
         print("\nSimulation Settings:")
-        for key, value in self.simulation_config.__dict__.items():
-            print(f"  {key}: {value}")
+        for f in fields(self.simulation_config):
+            print(f"  {f.name}: {getattr(self.simulation_config, f.name)}")
         
         print("\nSecurity Settings:")
-        for key, value in self.security_config.__dict__.items():
-            print(f"  {key}: {value}")
+        for f in fields(self.security_config):
+            print(f"  {f.name}: {getattr(self.security_config, f.name)}")
 
 
-# Global configuration instance
-config_manager = ConfigManager()
+@lru_cache(maxsize=1)
+def get_config() -> ConfigManager:
+    """Get the global configuration manager, loading it on first use."""
+    return ConfigManager()
 
 
-def get_config() -> ConfigManager:
-    """Get the global configuration manager."""
-    return config_manager
+def reset_cache() -> None:
+    """Drop the global configuration manager so the next access reloads it."""
+    get_config.cache_clear()
 
 
 def get_simulation_config() -> SimulationConfig:
     """Get simulation configuration."""
-    return config_manager.get_simulation_config()
+    return get_config().simulation_config
 
 
 def get_security_config() -> SecurityConfig:
     """Get security configuration."""
-    return config_manager.get_security_config()
+    return get_config().security_config
+
+
+def __getattr__(name: str) -> Any:
+    """Keep the former module-level ``config_manager`` attribute working, lazily."""
+    if name == "config_manager":
+        return get_config()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 if __name__ == "__main__":
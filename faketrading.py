@@ -13,11 +13,20 @@ import json
 import time
 import random
 import logging
-from datetime import datetime
+from array import array
+from datetime import datetime, timedelta
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Tuple, Any
+from typing import Dict, IO, List, Optional, Tuple, Any, Union
 import sys
 
+# Use orjson for faster JSON parsing/serialization when available
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 # Configure structured logging
 logging.basicConfig(
     level=logging.INFO,
@@ -26,6 +35,82 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Interval bit flags for the per-second logging mask
+_BIT_1_SECOND = 1
+_BIT_5_SECOND = 2
+_BIT_1_MINUTE = 4
+_BIT_5_MINUTE = 8
+_BIT_1_HOUR = 16
+
+def _make_market_data_validator():
+    """
+    Build the market data validator once at import time.
+
+    The returned function reads only the four OHLC fields (a missing key surfaces
+    as KeyError and is reported as ValueError) and returns them as a tuple.
+    """
+    required_keys = ("open", "high", "low", "close")
+    numeric_types = (int, float)
+
+    def validate(data: Dict[str, Any]) -> Tuple[float, float, float, float]:
+        # SECURITY: Validate required keys to prevent KeyError exploitation
+        try:
+            values = (data["open"], data["high"], data["low"], data["close"])
+        except KeyError:
+            missing = {key for key in required_keys if key not in data}
+            raise ValueError(f"Missing required keys in JSON: {missing}") from None
+
+        # SAFETY: Validate numeric types and logical constraints
+        for key, value in zip(required_keys, values):
+            if not isinstance(value, numeric_types):
+                raise ValueError(f"Value for '{key}' must be numeric, got {type(value)}")
+
+        open_price, high, low, close = values
+        if high < low:
+            raise ValueError(f"High price ({high}) cannot be less than low price ({low})")
+
+        # Additional market realism checks
+        if not low <= open_price <= high:
+            raise ValueError(f"Open price ({open_price}) must be within low-high range")
+
+        if not low <= close <= high:
+            raise ValueError(f"Close price ({close}) must be within low-high range")
+
+        return values
+
+    return validate
+
+_validate_market_data = _make_market_data_validator()
+
+@lru_cache(maxsize=None)
+def _convergence_weights(total_seconds: int, steps: Optional[int] = None) -> Tuple[float, ...]:
+    """Convergence weight for each second 1..steps (default total_seconds-1), as used by generate_price."""
+    if steps is None:
+        steps = total_seconds - 1
+    return tuple(min(0.9, second / total_seconds) for second in range(1, steps + 1))
+
+def _simulate_walk(start_price: float, close: float, low: float, high: float,
+                   volatility: float, total_seconds: int,
+                   steps: Optional[int] = None) -> List[float]:
+    """
+    Run the convergent random walk for seconds 1..steps (default total_seconds-1).
+
+    Takes plain scalars only, and the per-second weights and noise scales are
+    fixed for a run, so they are tabulated up front; each step is then two
+    multiply-adds and a clamp.
+    SAFETY: Every step is clamped to market bounds before feeding the next one
+    """
+    weights = _convergence_weights(total_seconds, steps)
+    noise_scales = [(1 - weight) * volatility for weight in weights]
+    gauss = random.gauss
+    price = start_price
+    path = []
+    for weight, noise_scale in zip(weights, noise_scales):
+        price += (close - price) * weight + gauss(0, 1) * noise_scale
+        price = max(low, min(high, price))
+        path.append(price)
+    return path
+
 class PriceSimulator:
     """
     Simulates price movements with convergence to target close price.
@@ -34,57 +119,84 @@ class PriceSimulator:
     SAFETY: Enforces price bounds and validates JSON structure
     """
     
-    def __init__(self, volatility: float = 0.5, data_file: str = "data.json"):
+    # Intervals to log at each second of the 60-second run: every second, every
+    # 5 seconds, 1_MINUTE at the end of the minute, 5_MINUTE/1_HOUR only at start
+    _INTERVAL_BITS = {
+        "1_SECOND": _BIT_1_SECOND,
+        "5_SECOND": _BIT_5_SECOND,
+        "1_MINUTE": _BIT_1_MINUTE,
+        "5_MINUTE": _BIT_5_MINUTE,
+        "1_HOUR": _BIT_1_HOUR,
+    }
+    _LOG_MASK = array('B', (
+        _BIT_1_SECOND
+        | (_BIT_5_SECOND if s % 5 == 0 else 0)
+        | (_BIT_1_MINUTE if s == 59 else 0)
+        | (_BIT_5_MINUTE | _BIT_1_HOUR if s == 0 else 0)
+        for s in range(60)
+    ))
+    _INTERVAL_NAMES = {bit: name for name, bit in _INTERVAL_BITS.items()}
+    
+    def __init__(self, volatility: float = 0.5, data_file: str = "data.json",
+                 max_history: int = 1000,
+                 data: Optional[Union[Dict[str, Any], IO]] = None):
+        # SAFETY: A bounded log keeps memory use predictable on long runs
+        if max_history <= 0:
+            raise ValueError(f"max_history must be positive, got {max_history}")
+            
         self.volatility = volatility
         self.data_file = data_file
-        self.price_log: List[Dict[str, Any]] = []
+        # In-memory market data (a dict, or a stream of JSON text/bytes) used instead of data_file
+        self._data = data
+        self.max_history = max_history
+        # Price log stored as preallocated parallel ring-buffer columns
+        # (epoch seconds, interval bit, price); oldest entries are overwritten
+        self._log_times = array('d', bytes(8 * max_history))
+        self._log_intervals = array('B', bytes(max_history))
+        self._log_prices = array('d', bytes(8 * max_history))
+        self._log_head = 0   # Slot for the next entry
+        self._log_count = 0  # Number of valid entries
+        # Console lines buffered during a run and written once per simulated second
+        self._pending_output: Optional[List[str]] = None
         self.current_price: float = 0.0
         self.market_data: Dict[str, float] = {}
         
     def load_market_data(self) -> Dict[str, float]:
         """
-        Load and validate market data from JSON file.
+        Load and validate market data from JSON file, or from the data given to the constructor.
         
         SECURITY: Validates JSON structure to prevent malformed data exploitation
         SAFETY: Ensures high >= low constraint for realistic market conditions
         """
         try:
-            data_path = Path(self.data_file)
-            if not data_path.exists():
-                raise FileNotFoundError(f"Market data file not found: {self.data_file}")
-                
-            with open(data_path, 'r') as f:
-                data = json.load(f)
-                
-            # SECURITY: Validate required keys to prevent KeyError exploitation
-            required_keys = {"open", "high", "low", "close"}
-            if not required_keys.issubset(data.keys()):
-                missing = required_keys - data.keys()
-                raise ValueError(f"Missing required keys in JSON: {missing}")
-                
-            # SAFETY: Validate numeric types and logical constraints
-            for key in required_keys:
-                if not isinstance(data[key], (int, float)):
-                    raise ValueError(f"Value for '{key}' must be numeric, got {type(data[key])}")
-                    
-            if data["high"] < data["low"]:
-                raise ValueError(f"High price ({data['high']}) cannot be less than low price ({data['low']})")
-                
-            # Additional market realism checks
-            if data["open"] < data["low"] or data["open"] > data["high"]:
-                raise ValueError(f"Open price ({data['open']}) must be within low-high range")
-                
-            if data["close"] < data["low"] or data["close"] > data["high"]:
-                raise ValueError(f"Close price ({data['close']}) must be within low-high range")
+            source = self._data
+            if source is None:
+                data_path = Path(self.data_file)
+                if not data_path.exists():
+                    raise FileNotFoundError(f"Market data file not found: {self.data_file}")
+                raw = data_path.read_bytes()
+                data = orjson.loads(raw) if ORJSON_AVAILABLE else json.loads(raw)
+            elif hasattr(source, "read"):
+                raw = source.read()
+                data = orjson.loads(raw) if ORJSON_AVAILABLE else json.loads(raw)
+                # A stream can only be read once; keep the parsed data for later loads
+                self._data = data
+            else:
+                data = source
                 
-            logger.info(f"Loaded market data: Open=${data['open']:.2f}, High=${data['high']:.2f}, Low=${data['low']:.2f}, Close=${data['close']:.2f}")
-            
-            # Store the data in instance variable
-            self.market_data = data
-            return data
+            # SECURITY/SAFETY: Validate keys, numeric types and price ordering
+            open_price, high, low, close = _validate_market_data(data)
+
+            logger.info(f"Loaded market data: Open=${open_price:.2f}, High=${high:.2f}, Low=${low:.2f}, Close=${close:.2f}")
+
+            # Store a plain dict of the validated fields in instance variable
+            market_data = {"open": open_price, "high": high, "low": low, "close": close}
+            self.market_data = market_data
+            return market_data
             
         except json.JSONDecodeError as e:
-            raise ValueError(f"Invalid JSON format in {self.data_file}: {e}")
+            origin = self.data_file if self._data is None else "market data"
+            raise ValueError(f"Invalid JSON format in {origin}: {e}")
         except Exception as e:
             logger.error(f"Failed to load market data: {e}")
             raise
@@ -112,35 +224,104 @@ class PriceSimulator:
         
         # SAFETY: Enforce market bounds to prevent unrealistic prices
         new_price = max(self.market_data["low"], min(self.market_data["high"], new_price))
-        
+
         return new_price
-        
-    def log_price(self, interval: str, price: float, timestamp: datetime = None) -> None:
+
+    def _precompute_path(self, total_seconds: int = 60) -> List[float]:
+        """
+        Generate the full price trajectory for seconds 1..total_seconds-1 in one pass.
+
+        SAFETY: Same convergent, bounds-clamped recurrence as generate_price
+        """
+        return _simulate_walk(
+            self.current_price,
+            self.market_data["close"],
+            self.market_data["low"],
+            self.market_data["high"],
+            self.volatility,
+            total_seconds,
+        )
+
+    def generate_prices_batch(self, duration: int) -> List[float]:
+        """
+        Generate prices for seconds 1..duration in one pass, starting from current_price.
+
+        Same sequence as calling generate_price(second, duration) for each second
+        and feeding each result back as current_price; current_price is not changed.
+        SAFETY: Same convergent, bounds-clamped recurrence as generate_price
+        """
+        if duration <= 0:
+            raise ValueError(f"duration must be positive, got {duration}")
+        return _simulate_walk(
+            self.current_price,
+            self.market_data["close"],
+            self.market_data["low"],
+            self.market_data["high"],
+            self.volatility,
+            duration,
+            duration,
+        )
+
+    def log_price(self, interval: str, price: float, timestamp: datetime = None,
+                  formatted_time: Optional[str] = None) -> None:
         """
         Log price data with structured format.
         
+        formatted_time is the console form of timestamp ("%Y-%m-%d %H:%M:%S");
+        callers logging the same timestamp repeatedly can pass it precomputed.
+        
         SECURITY: Sanitizes interval string to prevent log injection
         """
         if timestamp is None:
             timestamp = datetime.now()
             
         # SECURITY: Sanitize interval string (allow-list approach)
-        allowed_intervals = {"1_SECOND", "5_SECOND", "1_MINUTE", "5_MINUTE", "1_HOUR"}
-        if interval not in allowed_intervals:
+        interval_bit = self._INTERVAL_BITS.get(interval)
+        if interval_bit is None:
             logger.warning(f"Invalid interval type: {interval}")
             return
             
-        log_entry = {
-            "timestamp": timestamp.isoformat(),
-            "interval": interval,
-            "price": round(price, 2)
-        }
-        
-        self.price_log.append(log_entry)
+        slot = self._log_head
+        self._log_times[slot] = timestamp.timestamp()
+        self._log_intervals[slot] = interval_bit
+        self._log_prices[slot] = price
+        self._log_head = (slot + 1) % self.max_history
+        if self._log_count < self.max_history:
+            self._log_count += 1
         
         # Format output for console
-        formatted_time = timestamp.strftime("%Y-%m-%d %H:%M:%S")
-        print(f"[{formatted_time}] [{interval}] Price: ${price:.2f}")
+        if formatted_time is None:
+            formatted_time = timestamp.strftime("%Y-%m-%d %H:%M:%S")
+        line = f"[{formatted_time}] [{interval}] Price: ${price:.2f}\n"
+        if self._pending_output is None:
+            sys.stdout.write(line)
+        else:
+            self._pending_output.append(line)
+            
+    def _flush_output(self) -> None:
+        """Write buffered console lines in a single call."""
+        if self._pending_output:
+            output = "".join(self._pending_output)
+            self._pending_output.clear()
+            sys.stdout.write(output)
+            sys.stdout.flush()
+        
+    @property
+    def price_log(self) -> List[Dict[str, Any]]:
+        """
+        Logged prices as a list of {timestamp, interval, price} records, oldest first.
+        
+        Built on access from the ring buffer; holds at most max_history entries.
+        """
+        names = self._INTERVAL_NAMES
+        fromtimestamp = datetime.fromtimestamp
+        times, intervals, prices = self._log_times, self._log_intervals, self._log_prices
+        capacity = self.max_history
+        start = (self._log_head - self._log_count) % capacity
+        return [
+            {"timestamp": fromtimestamp(times[i]).isoformat(), "interval": names[intervals[i]], "price": prices[i]}
+            for i in ((start + n) % capacity for n in range(self._log_count))
+        ]
         
     def should_log_interval(self, second: int, interval_type: str) -> bool:
         """
@@ -148,75 +329,92 @@ class PriceSimulator:
         
         SAFETY: Prevents division by zero and handles edge cases
         """
-        if interval_type == "1_SECOND":
-            return True
-        elif interval_type == "5_SECOND":
-            return second % 5 == 0
-        elif interval_type == "1_MINUTE":
-            return second == 59  # Log at end of minute
-        elif interval_type == "5_MINUTE":
-            return second == 0   # Only at start for 1-minute simulation
-        elif interval_type == "1_HOUR":
-            return second == 0   # Only at start for 1-minute simulation
-        return False
+        bit = self._INTERVAL_BITS.get(interval_type)
+        if bit is None:
+            return False
+        if 0 <= second < len(self._LOG_MASK):
+            return bool(self._LOG_MASK[second] & bit)
+        # Outside the 60-second window only the periodic intervals can fire
+        return bit == _BIT_1_SECOND or (bit == _BIT_5_SECOND and second % 5 == 0)
         
-    def run_simulation(self) -> List[Dict[str, Any]]:
+    def run_simulation(self, steps: int = 60) -> List[Dict[str, Any]]:
         """
-        Execute 60-second price simulation with multi-interval logging.
+        Execute a price simulation of `steps` seconds (60 by default) with multi-interval logging.
         
+        Shorter runs follow the same convergent walk, scaled to their length, and
+        still end exactly on the close price.
         SAFETY: Implements precise timing control and guaranteed convergence
         """
+        if steps <= 0:
+            raise ValueError(f"steps must be positive, got {steps}")
+            
         try:
             # Load and validate market data
             self.market_data = self.load_market_data()
             self.current_price = self.market_data["open"]
             
             logger.info(f"Starting simulation with volatility={self.volatility}")
-            start_time = time.time()
+            start_time = time.monotonic()
             simulation_start = datetime.now()
             
+            # Absolute monotonic deadline for the end of each second, so a late tick doesn't compound drift
+            deadlines = [start_time + s for s in range(1, steps)]
+            
+            # Timestamps for every second of the run, including the final close
+            timestamps = [simulation_start + timedelta(seconds=s) for s in range(steps + 1)]
+            display_times = [t.strftime("%Y-%m-%d %H:%M:%S") for t in timestamps]
+            
+            log_mask = self._LOG_MASK
+            self._pending_output = []
+            
             # Log initial price at multiple intervals
-            if self.should_log_interval(0, "1_SECOND"):
-                self.log_price("1_SECOND", self.current_price, simulation_start)
-            if self.should_log_interval(0, "5_SECOND"):
-                self.log_price("5_SECOND", self.current_price, simulation_start)
-            if self.should_log_interval(0, "5_MINUTE"):
-                self.log_price("5_MINUTE", self.current_price, simulation_start)
-            if self.should_log_interval(0, "1_HOUR"):
-                self.log_price("1_HOUR", self.current_price, simulation_start)
+            mask = log_mask[0]
+            start_display = display_times[0]
+            if mask & _BIT_1_SECOND:
+                self.log_price("1_SECOND", self.current_price, simulation_start, start_display)
+            if mask & _BIT_5_SECOND:
+                self.log_price("5_SECOND", self.current_price, simulation_start, start_display)
+            if mask & _BIT_5_MINUTE:
+                self.log_price("5_MINUTE", self.current_price, simulation_start, start_display)
+            if mask & _BIT_1_HOUR:
+                self.log_price("1_HOUR", self.current_price, simulation_start, start_display)
+            self._flush_output()
                 
-            # Main simulation loop (59 iterations for seconds 1-59)
-            for second in range(1, 60):
-                # Generate new price with convergence bias
-                self.current_price = self.generate_price(second)
+            # Precompute the whole convergent walk before the timed loop
+            path = self._precompute_path(steps)
+
+            # Main simulation loop (seconds 1..steps-1; 59 iterations for a full minute)
+            for second in range(1, steps):
+                # Take the precomputed price for this second
+                self.current_price = path[second - 1]
                 
-                # Calculate precise timestamp for this second
-                current_time = simulation_start.replace(
-                    second=(simulation_start.second + second) % 60,
-                    minute=simulation_start.minute + (simulation_start.second + second) // 60
-                )
+                # Precise timestamp for this second
+                current_time = timestamps[second]
+                current_display = display_times[second]
                 
-                # Log at appropriate intervals
-                if self.should_log_interval(second, "1_SECOND"):
-                    self.log_price("1_SECOND", self.current_price, current_time)
-                if self.should_log_interval(second, "5_SECOND"):
-                    self.log_price("5_SECOND", self.current_price, current_time)
-                if self.should_log_interval(second, "1_MINUTE"):
-                    self.log_price("1_MINUTE", self.current_price, current_time)
+                # Log at appropriate intervals; past the 60-second table only the
+                # periodic intervals fire, as in should_log_interval
+                if second < len(log_mask):
+                    mask = log_mask[second]
+                else:
+                    mask = _BIT_1_SECOND | (_BIT_5_SECOND if second % 5 == 0 else 0)
+                if mask & _BIT_1_SECOND:
+                    self.log_price("1_SECOND", self.current_price, current_time, current_display)
+                if mask & _BIT_5_SECOND:
+                    self.log_price("5_SECOND", self.current_price, current_time, current_display)
+                if mask & _BIT_1_MINUTE:
+                    self.log_price("1_MINUTE", self.current_price, current_time, current_display)
+                self._flush_output()
                     
                 # SAFETY: Precise timing control to maintain 1-second intervals
-                elapsed = time.time() - start_time
-                target_elapsed = second
-                if elapsed < target_elapsed:
-                    time.sleep(target_elapsed - elapsed)
+                delay = deadlines[second - 1] - time.monotonic()
+                if delay > 0:
+                    time.sleep(delay)
                     
             # SAFETY: Force exact convergence to target close price
             self.current_price = self.market_data["close"]
-            final_time = simulation_start.replace(
-                second=(simulation_start.second + 60) % 60,
-                minute=simulation_start.minute + (simulation_start.second + 60) // 60
-            )
-            self.log_price("1_MINUTE", self.current_price, final_time)
+            self.log_price("1_MINUTE", self.current_price, timestamps[steps], display_times[steps])
+            self._flush_output()
             
             logger.info(f"Simulation complete. Final price set to target close: ${self.current_price:.2f}")
             return self.price_log
@@ -224,6 +422,9 @@ class PriceSimulator:
         except Exception as e:
             logger.error(f"Simulation failed: {e}")
             raise
+        finally:
+            self._flush_output()
+            self._pending_output = None
             
     def export_results(self, filename: str = "simulation_results.json") -> None:
         """
@@ -242,13 +443,17 @@ class PriceSimulator:
                     "volatility": self.volatility,
                     "data_file": self.data_file,
                     "market_data": self.market_data,
-                    "total_records": len(self.price_log)
+                    "total_records": self._log_count
                 },
                 "price_data": self.price_log
             }
             
-            with open(safe_filename, 'w') as f:
-                json.dump(output_data, f, indent=2)
+            if ORJSON_AVAILABLE:
+                with open(safe_filename, 'wb') as f:
+                    f.write(orjson.dumps(output_data, option=orjson.OPT_INDENT_2))
+            else:
+                with open(safe_filename, 'w') as f:
+                    json.dump(output_data, f, indent=2)
                 
             logger.info(f"Results exported to {safe_filename}")
             
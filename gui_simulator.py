@@ -11,16 +11,18 @@ from tkinter import ttk, messagebox, filedialog
 import threading
 import time
 import json
-from datetime import datetime
 from pathlib import Path
-from typing import Dict, Any, Optional
-import queue
+from typing import Dict, Any, List, Optional
+from array import array
+from collections import deque
 
 # Try to import matplotlib for candlestick charts
 try:
-    import matplotlib.pyplot as plt
+    import numpy as np  # matplotlib hard-depends on numpy
     from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
     from matplotlib.figure import Figure
+    from matplotlib.collections import LineCollection, PolyCollection
+    from matplotlib.lines import Line2D
     from matplotlib.patches import Rectangle
     MATPLOTLIB_AVAILABLE = True
 except ImportError:
@@ -34,6 +36,12 @@ from faketrading import PriceSimulator
 class TradingSimulatorGUI:
     """GUI application for the Fake Trading Price Simulator."""
     
+    # Queue messages handled per update_display pass, so Tk input events are not starved
+    MAX_UPDATES_PER_PASS = 64
+    
+    # Candle interval selector labels in seconds
+    _INTERVAL_MAP = {"1 sec": 1, "5 sec": 5, "1 min": 60, "5 min": 300}
+    
     def __init__(self, root):
         self.root = root
         self.root.title("Fake Trading Price Simulator")
@@ -44,10 +52,14 @@ class TradingSimulatorGUI:
         self.simulator: Optional[PriceSimulator] = None
         self.simulation_thread: Optional[threading.Thread] = None
         self.is_running = False
-        self.pause_simulation = False
+        # Worker thread signals: stop is set to end the run; resume is cleared while paused
+        self._stop_event = threading.Event()
+        self._resume_event = threading.Event()
+        self._resume_event.set()
         
-        # Data queue for thread communication
-        self.data_queue = queue.Queue()
+        # Data queue for thread communication (single producer/consumer;
+        # deque append/popleft are atomic, so no extra locking is needed)
+        self.data_queue = deque()
         
         # GUI variables
         self.volatility_var = tk.DoubleVar(value=0.5)
@@ -59,18 +71,56 @@ class TradingSimulatorGUI:
         self.data_file_var = tk.StringVar(value="data.json")
         self.output_file_var = tk.StringVar(value="simulation_results.json")
         self.log_level_var = tk.StringVar(value="INFO")
+        # Repaint the chart every N ticks (and whenever a candle closes)
+        self.plot_skip_var = tk.IntVar(value=5)
+        # Label text for per-tick displays; setting a variable is cheaper than Label.config
+        self.current_price_var = tk.StringVar(value="$0.00")
+        self.progress_text_var = tk.StringVar(value="0/60 seconds")
+        self.last_update_var = tk.StringVar(value="")
         
-        # Price history for plotting
-        self.price_history = []
-        self.time_history = []
+        # Price history: compact typed arrays, preallocated for the run length at start
+        self.reset_history()
         
         # Candlestick aggregation and chart objects
-        self.candlestick_data = []  # List[Dict[str, float]]
-        self.current_candle = None
+        # Closed candles as struct-of-arrays (times, OHLC rows), grown geometrically
+        self._candle_times = None
+        self._candle_ohlc = None
+        self._n_candles = 0
+        # In-progress candle as plain scalars; _cur_t is None when no candle is open
+        self._cur_t = None
+        self._cur_bucket = None
+        self._cur_o = self._cur_h = self._cur_l = self._cur_c = 0.0
+        self._candle_interval = 1
+        self._candle_interval_sec = 1
+        
+        # Run settings snapshotted at start so the per-tick paths never read Tk variables
+        self._duration = 60
+        self._output_file = "simulation_results.json"
+        self._plot_skip = 5
         self.figure = None
         self.canvas = None
         self.ax = None
         
+        # Blitting state: cached static background, in-progress candle artists,
+        # and how many closed candles already have artists on the axes
+        self._background = None
+        self._live_artists = ()
+        self._wick_collection = None
+        self._body_collection = None
+        self._doji_collection = None
+        self._drawn_candles = 0
+        self._chart_ylim = None
+        self._candle_just_closed = False
+        self._redraw_pending = False
+        
+        # Log display is capped at _log_max lines; lines from one update pass are inserted together
+        self._log_lines = 0
+        self._log_max = 1000
+        self._pending_log = []
+        # Last wall-clock second formatted as HH:MM:SS, reused until the second changes
+        self._last_ts_sec = 0
+        self._last_ts_str = ""
+        
         self.setup_gui()
         self.setup_bindings()
         
@@ -135,6 +185,12 @@ class TradingSimulatorGUI:
                                state="readonly", width=10)
         log_combo.grid(row=3, column=1, sticky=(tk.W, tk.E), padx=(5, 0), pady=2)
         
+        # Chart Refresh Rate
+        ttk.Label(params_frame, text="Plot Every (ticks):").grid(row=4, column=0, sticky=tk.W, pady=2)
+        plot_skip_spin = tk.Spinbox(params_frame, from_=1, to=60,
+                                    textvariable=self.plot_skip_var, width=10)
+        plot_skip_spin.grid(row=4, column=1, sticky=(tk.W, tk.E), padx=(5, 0), pady=2)
+        
         # File Configuration
         file_frame = ttk.LabelFrame(control_frame, text="File Configuration", padding="5")
         file_frame.pack(fill=tk.X, pady=(0, 10))
@@ -188,7 +244,7 @@ class TradingSimulatorGUI:
         price_frame.pack(fill=tk.X, pady=(0, 10))
         
         ttk.Label(price_frame, text="Current Price:", font=("Arial", 12, "bold")).pack(side=tk.LEFT)
-        self.current_price_label = ttk.Label(price_frame, text="$0.00", 
+        self.current_price_label = ttk.Label(price_frame, textvariable=self.current_price_var, 
                                            font=("Arial", 16, "bold"), foreground="green")
         self.current_price_label.pack(side=tk.LEFT, padx=(10, 0))
         
@@ -199,7 +255,7 @@ class TradingSimulatorGUI:
         ttk.Label(progress_frame, text="Progress:").pack(side=tk.LEFT)
         self.progress_bar = ttk.Progressbar(progress_frame, mode='determinate', length=300)
         self.progress_bar.pack(side=tk.LEFT, padx=(10, 0), fill=tk.X, expand=True)
-        self.progress_label = ttk.Label(progress_frame, text="0/60 seconds")
+        self.progress_label = ttk.Label(progress_frame, textvariable=self.progress_text_var)
         self.progress_label.pack(side=tk.LEFT, padx=(10, 0))
         
         # Candlestick Chart
@@ -209,13 +265,11 @@ class TradingSimulatorGUI:
         if MATPLOTLIB_AVAILABLE:
             self.figure = Figure(figsize=(8, 4), dpi=100)
             self.ax = self.figure.add_subplot(111)
-            self.ax.set_title("Real-time Candlestick Chart")
-            self.ax.set_xlabel("Time (seconds)")
-            self.ax.set_ylabel("Price ($)")
-            self.ax.grid(True, alpha=0.3)
             
             self.canvas = FigureCanvasTkAgg(self.figure, chart_frame)
-            self.canvas.draw()
+            # Re-capture the blit background after every full draw (first show, resize, limit change)
+            self.canvas.mpl_connect('draw_event', self.on_chart_draw)
+            self.reset_chart("Real-time Candlestick Chart")
             self.canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
         else:
             ttk.Label(chart_frame, text="Matplotlib is required for candlestick charts.\nInstall with: pip install matplotlib").pack(fill=tk.BOTH, expand=True)
@@ -239,7 +293,7 @@ class TradingSimulatorGUI:
         self.status_label = ttk.Label(status_frame, text="Ready")
         self.status_label.pack(side=tk.LEFT)
         
-        self.simulation_time_label = ttk.Label(status_frame, text="")
+        self.simulation_time_label = ttk.Label(status_frame, textvariable=self.last_update_var)
         self.simulation_time_label.pack(side=tk.RIGHT)
         
     def setup_bindings(self):
@@ -247,6 +301,11 @@ class TradingSimulatorGUI:
         # Update progress when volatility changes
         self.volatility_var.trace_add('write', self.on_volatility_change)
         
+        # Resolve the candle interval when the selector changes, not per tick
+        self.candle_interval_var.trace_add('write', self.on_candle_interval_change)
+        self.on_candle_interval_change()
+        self.plot_skip_var.trace_add('write', self.on_plot_skip_change)
+        
         # Update display periodically
         self.root.after(100, self.update_display)
         
@@ -289,7 +348,7 @@ Range: ${data['high'] - data['low']:.2f}"""
                 self.market_data_text.insert(1.0, market_info)
                 
                 # Update current price
-                self.current_price_label.config(text=f"${data['open']:.2f}")
+                self.current_price_var.set(f"${data['open']:.2f}")
                 
                 self.log_message("Market data loaded successfully")
             else:
@@ -302,6 +361,14 @@ Range: ${data['high'] - data['low']:.2f}"""
         volatility = self.volatility_var.get()
         self.log_message(f"Volatility changed to: {volatility:.2f}")
         
+    def on_candle_interval_change(self, *args):
+        """Cache the selected candle interval in seconds."""
+        self._candle_interval_sec = self.get_candle_interval_seconds()
+        
+    def on_plot_skip_change(self, *args):
+        """Cache the chart repaint interval."""
+        self._plot_skip = self.get_plot_skip()
+        
     def start_simulation(self):
         """Start the simulation in a separate thread."""
         if self.is_running:
@@ -314,28 +381,30 @@ Range: ${data['high'] - data['low']:.2f}"""
                 data_file=self.data_file_var.get()
             )
             
-            # Clear previous data
-            self.price_history = []
-            self.time_history = []
-            if MATPLOTLIB_AVAILABLE and self.ax is not None:
-                self.ax.clear()
-                self.ax.set_title("Real-time Candlestick Chart")
-                self.ax.set_xlabel("Time (seconds)")
-                self.ax.set_ylabel("Price ($)")
-                self.ax.grid(True, alpha=0.3)
-                self.candlestick_data = []
-                self.current_candle = None
-                self.canvas.draw()
-            self.log_text.delete(1.0, tk.END)
-            
             # Map total duration from selector
             total_duration = self.map_duration_to_seconds(self.total_duration_var.get())
             if isinstance(total_duration, int) and total_duration > 0:
                 self.duration_var.set(total_duration)
+            self._duration = self.duration_var.get()
+            self._output_file = self.output_file_var.get()
+            # Progress is measured in seconds, so ticks map onto the bar without scaling
+            self.progress_bar.configure(maximum=self._duration)
+            self.progress_bar['value'] = 0
+            
+            # Clear previous data (one tick per second, plus the opening and closing updates)
+            self.reset_history(self._duration + 2)
+            if MATPLOTLIB_AVAILABLE and self.ax is not None:
+                self.reset_candles()
+                self._candle_interval = self._candle_interval_sec
+                interval_label = self.candle_interval_var.get()
+                total_label = self.total_duration_var.get()
+                self.reset_chart(f"Candlesticks ({interval_label}) · Total {total_label}")
+            self.clear_log()
             
             # Start simulation thread
             self.is_running = True
-            self.pause_simulation = False
+            self._stop_event.clear()
+            self._resume_event.set()
             self.simulation_thread = threading.Thread(target=self.run_simulation_thread)
             self.simulation_thread.daemon = True
             self.simulation_thread.start()
@@ -360,7 +429,7 @@ Range: ${data['high'] - data['low']:.2f}"""
             self.simulator.current_price = market_data["open"]
             
             # Send initial data
-            self.data_queue.put({
+            self.data_queue.append({
                 'type': 'price_update',
                 'price': self.simulator.current_price,
                 'second': 0,
@@ -368,49 +437,37 @@ Range: ${data['high'] - data['low']:.2f}"""
             })
             
             # Run simulation
-            duration = self.duration_var.get()
+            duration = self._duration
+            # Generate the whole path up front; the loop below only paces delivery
+            prices = self.simulator.generate_prices_batch(duration)
             start_time = time.time()
             
             for second in range(1, duration + 1):
-                if not self.is_running:
+                # Block while paused; stop_simulation also releases this wait
+                self._resume_event.wait()
+                if self._stop_event.is_set():
                     break
                     
-                # Wait for pause to be released
-                while self.pause_simulation and self.is_running:
-                    time.sleep(0.1)
-                    
-                if not self.is_running:
-                    break
-                    
-                # Generate next price
-                self.simulator.current_price = self.simulator.generate_price(second, duration)
+                # Next price from the precomputed path
+                self.simulator.current_price = prices[second - 1]
                 
                 # Send data to GUI
-                self.data_queue.put({
+                self.data_queue.append({
                     'type': 'price_update',
                     'price': self.simulator.current_price,
                     'second': second,
                     'interval': '1_SECOND'
                 })
                 
-                # Log at intervals
-                if second % 5 == 0:
-                    self.data_queue.put({
-                        'type': 'price_update',
-                        'price': self.simulator.current_price,
-                        'second': second,
-                        'interval': '5_SECOND'
-                    })
-                
-                # Sleep for 1 second
+                # Wait out the rest of the second; wakes immediately on stop
                 elapsed = time.time() - start_time
                 target_elapsed = second
-                if elapsed < target_elapsed:
-                    time.sleep(target_elapsed - elapsed)
+                if elapsed < target_elapsed and self._stop_event.wait(target_elapsed - elapsed):
+                    break
                     
             # Final price (convergence)
             self.simulator.current_price = market_data["close"]
-            self.data_queue.put({
+            self.data_queue.append({
                 'type': 'price_update',
                 'price': self.simulator.current_price,
                 'second': duration,
@@ -418,25 +475,26 @@ Range: ${data['high'] - data['low']:.2f}"""
             })
             
             # Export results
-            self.simulator.export_results(self.output_file_var.get())
+            self.simulator.export_results(self._output_file)
             
             # Send completion signal
-            self.data_queue.put({'type': 'simulation_complete'})
+            self.data_queue.append({'type': 'simulation_complete'})
             
         except Exception as e:
-            self.data_queue.put({
+            self.data_queue.append({
                 'type': 'error',
                 'message': str(e)
             })
             
     def pause_simulation_toggle(self):
         """Toggle simulation pause."""
-        self.pause_simulation = not self.pause_simulation
-        if self.pause_simulation:
+        if self._resume_event.is_set():
+            self._resume_event.clear()
             self.pause_button.config(text="Resume")
             self.status_label.config(text="Simulation Paused")
             self.log_message("Simulation paused")
         else:
+            self._resume_event.set()
             self.pause_button.config(text="Pause")
             self.status_label.config(text="Simulation Running")
             self.log_message("Simulation resumed")
@@ -444,7 +502,8 @@ Range: ${data['high'] - data['low']:.2f}"""
     def stop_simulation(self):
         """Stop the simulation."""
         self.is_running = False
-        self.pause_simulation = False
+        self._stop_event.set()
+        self._resume_event.set()
         
         # Update UI
         self.start_button.config(state=tk.NORMAL)
@@ -456,120 +515,223 @@ Range: ${data['high'] - data['low']:.2f}"""
         
     def reset_simulation(self):
         """Reset the simulation display."""
-        self.price_history = []
-        self.time_history = []
+        self.reset_history()
         if MATPLOTLIB_AVAILABLE and self.ax is not None:
-            self.ax.clear()
-            self.ax.set_title("Real-time Candlestick Chart")
-            self.ax.set_xlabel("Time (seconds)")
-            self.ax.set_ylabel("Price ($)")
-            self.ax.grid(True, alpha=0.3)
-            self.candlestick_data = []
-            self.current_candle = None
-            self.canvas.draw()
-        self.log_text.delete(1.0, tk.END)
-        self.current_price_label.config(text="$0.00")
+            self.reset_candles()
+            self.reset_chart("Real-time Candlestick Chart")
+        self.clear_log()
+        self.current_price_var.set("$0.00")
         self.progress_bar['value'] = 0
-        self.progress_label.config(text=f"0/{self.duration_var.get()} seconds")
+        self.progress_text_var.set(f"0/{self.duration_var.get()} seconds")
         self.status_label.config(text="Ready")
-        self.simulation_time_label.config(text="")
+        self.last_update_var.set("")
         
         self.log_message("Display reset")
 
+    def reset_history(self, capacity: int = 0):
+        """Drop the price history and preallocate room for the next run."""
+        self._price_arr = array('d', [0.0]) * capacity
+        self._time_arr = array('i', [0]) * capacity
+        self._n_prices = 0
+
+    @property
+    def price_history(self) -> List[float]:
+        """Prices received so far, oldest first."""
+        return self._price_arr[:self._n_prices].tolist()
+
+    @property
+    def time_history(self) -> List[int]:
+        """Simulation seconds matching price_history."""
+        return self._time_arr[:self._n_prices].tolist()
+
+    def reset_candles(self, capacity=64):
+        """Drop all candles and preallocate storage for the next run."""
+        self._candle_times = np.empty(capacity, dtype=np.int64)
+        self._candle_ohlc = np.empty((capacity, 4), dtype=np.float64)
+        self._n_candles = 0
+        self._cur_t = None
+        self._cur_bucket = None
+
+    def close_current_candle(self):
+        """Append the in-progress candle to the closed-candle arrays."""
+        n = self._n_candles
+        if n == len(self._candle_times):
+            # np.resize keeps existing rows when growing (row-major layout)
+            self._candle_times = np.resize(self._candle_times, 2 * n)
+            self._candle_ohlc = np.resize(self._candle_ohlc, (2 * n, 4))
+        self._candle_times[n] = self._cur_t
+        self._candle_ohlc[n] = (self._cur_o, self._cur_h, self._cur_l, self._cur_c)
+        self._n_candles = n + 1
+        self._cur_t = None
+
     def update_candlestick_data(self, second, price):
-        """Aggregate tick updates into 5-second OHLC candles."""
-        candle_interval = self.get_candle_interval_seconds()
-        
-        if second % candle_interval == 0:
-            # Start a new candle at boundaries; store the previous one
-            if self.current_candle is not None:
-                self.candlestick_data.append(self.current_candle)
-            self.current_candle = {
-                'time': second,
-                'open': price,
-                'high': price,
-                'low': price,
-                'close': price
-            }
+        """Aggregate tick updates into OHLC candles of the interval chosen at start."""
+        interval = self._candle_interval
+        bucket = second // interval
+        
+        if bucket != self._cur_bucket:
+            # Entered a new interval bucket; store the previous candle
+            if self._cur_t is not None:
+                self.close_current_candle()
+                self._candle_just_closed = True
+            self._cur_bucket = bucket
+            self._cur_t = bucket * interval
+            self._cur_o = self._cur_h = self._cur_l = self._cur_c = price
         else:
-            if self.current_candle is not None:
-                self.current_candle['high'] = max(self.current_candle['high'], price)
-                self.current_candle['low'] = min(self.current_candle['low'], price)
-                self.current_candle['close'] = price
+            if price > self._cur_h:
+                self._cur_h = price
+            if price < self._cur_l:
+                self._cur_l = price
+            self._cur_c = price
 
-    def update_candlestick_chart(self):
-        """Render candlesticks on the chart."""
-        if not MATPLOTLIB_AVAILABLE or self.ax is None:
-            return
-        
+    def reset_chart(self, title):
+        """Clear the axes and create the animated artists for the in-progress candle."""
         self.ax.clear()
-        
-        # Include the in-progress candle
-        if self.current_candle is not None:
-            temp_data = self.candlestick_data + [self.current_candle]
-        else:
-            temp_data = self.candlestick_data
-        
-        if len(temp_data) > 0:
-            times = [c['time'] for c in temp_data]
-            opens = [c['open'] for c in temp_data]
-            highs = [c['high'] for c in temp_data]
-            lows = [c['low'] for c in temp_data]
-            closes = [c['close'] for c in temp_data]
-            self.plot_candlesticks(times, opens, highs, lows, closes)
-        
-        # Title reflects selected interval and total duration
-        interval_label = self.candle_interval_var.get()
-        total_label = self.total_duration_var.get()
-        self.ax.set_title(f"Candlesticks ({interval_label}) · Total {total_label}")
+        self.ax.set_title(title)
         self.ax.set_xlabel("Time (seconds)")
         self.ax.set_ylabel("Price ($)")
         self.ax.grid(True, alpha=0.3)
+        self.ax.set_xlim(-1, self._duration + 1)
+        
+        # Closed candles: one collection each for wicks, bodies and dojis, updated in place
+        self._wick_collection = LineCollection([], colors='black', linewidths=1)
+        self._body_collection = PolyCollection([], edgecolors='black', linewidths=1)
+        self._doji_collection = LineCollection([], colors='black', linewidths=2)
+        self.ax.add_collection(self._wick_collection, autolim=False)
+        self.ax.add_collection(self._body_collection, autolim=False)
+        self.ax.add_collection(self._doji_collection, autolim=False)
+        
+        # The in-progress candle is excluded from full draws and blitted over the background
+        live_wick = Line2D([], [], color='black', linewidth=1, animated=True, visible=False)
+        live_body = Rectangle((0, 0), 0.4, 0, edgecolor='black', linewidth=1, animated=True, visible=False)
+        live_doji = Line2D([], [], color='black', linewidth=2, animated=True, visible=False)
+        self.ax.add_line(live_wick)
+        self.ax.add_patch(live_body)
+        self.ax.add_line(live_doji)
+        self._live_artists = (live_wick, live_body, live_doji)
+        
+        self._drawn_candles = 0
+        self._chart_ylim = None
+        self._background = None
+        self.schedule_redraw()
+
+    def schedule_redraw(self):
+        """Queue a chart render on the Tk main loop; repeated requests coalesce into one."""
+        if not self._redraw_pending:
+            self._redraw_pending = True
+            self.root.after_idle(self._do_redraw)
+
+    def _do_redraw(self):
+        """Run a scheduled chart render."""
+        self._redraw_pending = False
+        self.update_candlestick_chart()
+
+    def on_chart_draw(self, event):
+        """Cache the static background after a full draw and paint the live candle on top."""
+        self._background = self.canvas.copy_from_bbox(self.ax.bbox)
+        for artist in self._live_artists:
+            self.ax.draw_artist(artist)
+
+    def update_live_candle(self):
+        """Move the in-progress candle artists to the current candle's OHLC."""
+        live_wick, live_body, live_doji = self._live_artists
+        if self._cur_t is None:
+            for artist in self._live_artists:
+                artist.set_visible(False)
+            return
+        
+        t, o, h, l, c = self._cur_t, self._cur_o, self._cur_h, self._cur_l, self._cur_c
+        live_wick.set_data([t, t], [l, h])
+        live_wick.set_visible(True)
+        
+        body_height = abs(c - o)
+        if body_height > 0:
+            live_body.set_bounds(t - 0.2, min(o, c), 0.4, body_height)
+            live_body.set_facecolor('green' if c >= o else 'red')
+            live_body.set_visible(True)
+            live_doji.set_visible(False)
+        else:
+            live_doji.set_data([t - 0.2, t + 0.2], [o, o])
+            live_doji.set_visible(True)
+            live_body.set_visible(False)
+
+    def update_candlestick_chart(self):
+        """Render candlesticks: closed candles are drawn once, the live one is blitted."""
+        if not MATPLOTLIB_AVAILABLE or self.ax is None:
+            return
+        self._candle_just_closed = False
+        
+        # Closed candles changed since the last render: refresh the collections (part of the background)
+        n = self._n_candles
+        if n > self._drawn_candles:
+            ohlc = self._candle_ohlc[:n]
+            self.plot_candlesticks(self._candle_times[:n],
+                                   ohlc[:, 0], ohlc[:, 1], ohlc[:, 2], ohlc[:, 3])
+            self._drawn_candles = n
+            self._background = None
         
         # Y-limits from market data if available
         if self.simulator and self.simulator.market_data:
             low = self.simulator.market_data['low']
             high = self.simulator.market_data['high']
             margin = (high - low) * 0.1
-            self.ax.set_ylim(low - margin, high + margin)
+            ylim = (low - margin, high + margin)
+            if ylim != self._chart_ylim:
+                self.ax.set_ylim(*ylim)
+                self._chart_ylim = ylim
+                self._background = None
+        
+        self.update_live_candle()
         
-        if self.canvas is not None:
+        if self.canvas is None:
+            return
+        if self._background is None:
+            # Static content changed: full draw, which re-captures the background
             self.canvas.draw()
+        else:
+            self.canvas.restore_region(self._background)
+            for artist in self._live_artists:
+                self.ax.draw_artist(artist)
+        self.canvas.blit(self.ax.bbox)
 
     def plot_candlesticks(self, times, opens, highs, lows, closes):
-        """Draw candle wicks and bodies."""
-        for i in range(len(times)):
-            t = times[i]
-            o = opens[i]
-            h = highs[i]
-            l = lows[i]
-            c = closes[i]
-            
-            is_bullish = c >= o
-            color = 'green' if is_bullish else 'red'
-            
-            # Wick
-            self.ax.plot([t, t], [l, h], color='black', linewidth=1)
-            
-            # Body
-            body_height = abs(c - o)
-            if body_height > 0:
-                rect = Rectangle((t - 0.2, min(o, c)), 0.4, body_height, facecolor=color, edgecolor='black', linewidth=1)
-                self.ax.add_patch(rect)
-            else:
-                # Doji
-                self.ax.plot([t - 0.2, t + 0.2], [o, o], color='black', linewidth=2)
+        """Set candle wicks, bodies and dojis on the chart collections from OHLC arrays."""
+        times = np.asarray(times, dtype=np.float64)
+        bull = closes >= opens
+        bottoms = np.minimum(opens, closes)
+        tops = np.maximum(opens, closes)
+        has_body = tops > bottoms
+        left = times - 0.2
+        right = times + 0.2
+        
+        # Wicks: (N, 2, 2) segments from (t, low) to (t, high)
+        wick_segs = np.stack([np.column_stack([times, lows]),
+                              np.column_stack([times, highs])], axis=1)
+        self._wick_collection.set_segments(wick_segs)
+        
+        # Bodies: (M, 4, 2) rectangle corners for candles with a non-zero body
+        verts = np.stack([np.column_stack([left, bottoms]),
+                          np.column_stack([right, bottoms]),
+                          np.column_stack([right, tops]),
+                          np.column_stack([left, tops])], axis=1)[has_body]
+        self._body_collection.set_verts(verts)
+        self._body_collection.set_facecolor(np.where(bull[has_body], 'green', 'red'))
+        
+        # Dojis (open == close): a thick horizontal tick at the open
+        doji_segs = np.stack([np.column_stack([left, opens]),
+                              np.column_stack([right, opens])], axis=1)[~has_body]
+        self._doji_collection.set_segments(doji_segs)
+
+    def get_plot_skip(self) -> int:
+        """Number of ticks between chart repaints (at least 1)."""
+        try:
+            return max(1, int(self.plot_skip_var.get()))
+        except (tk.TclError, ValueError):
+            return 1
 
     def get_candle_interval_seconds(self) -> int:
         """Map UI selection to seconds."""
-        value = (self.candle_interval_var.get() or "1 sec").strip().lower()
-        if value.startswith("5 min"):
-            return 300
-        if value.startswith("1 min"):
-            return 60
-        if value.startswith("5 sec"):
-            return 5
-        return 1
+        return self._INTERVAL_MAP.get(self.candle_interval_var.get(), 1)
 
     def map_duration_to_seconds(self, value: str) -> int:
         """Map a duration label (e.g., '1 sec', '5 min') to seconds."""
@@ -589,56 +751,79 @@ Range: ${data['high'] - data['low']:.2f}"""
         
     def update_display(self):
         """Update the display with data from the simulation thread."""
-        try:
-            while True:
-                data = self.data_queue.get_nowait()
-                
-                if data['type'] == 'price_update':
-                    self.update_price_display(data)
-                elif data['type'] == 'simulation_complete':
+        # Every tick is recorded, but labels are refreshed once per pass from the latest one
+        latest = None
+        for _ in range(self.MAX_UPDATES_PER_PASS):
+            if not self.data_queue:
+                break
+            data = self.data_queue.popleft()
+            
+            if data['type'] == 'price_update':
+                self.record_price(data)
+                latest = data
+            else:
+                if latest is not None:
+                    self.update_price_display(latest)
+                    latest = None
+                if data['type'] == 'simulation_complete':
                     self.on_simulation_complete()
                 elif data['type'] == 'error':
                     messagebox.showerror("Simulation Error", data['message'])
                     self.stop_simulation()
-                    
-        except queue.Empty:
-            pass
         
-        # Schedule next update
-        self.root.after(100, self.update_display)
+        if latest is not None:
+            self.update_price_display(latest)
+        self.flush_log()
         
-    def update_price_display(self, data):
-        """Update price display with new data."""
+        # Schedule next update; come back sooner if a backlog is left
+        self.root.after(10 if self.data_queue else 100, self.update_display)
+        
+    def record_price(self, data):
+        """Record one tick: history, candle aggregation and log line."""
         price = data['price']
         second = data['second']
         interval = data['interval']
-        
-        # Update current price
-        self.current_price_label.config(text=f"${price:.2f}")
-        
-        # Update progress (label reflects candle interval selection)
-        duration = self.duration_var.get()
-        progress = (second / duration) * 100
-        self.progress_bar['value'] = progress
-        self.progress_label.config(text=f"{second}/{duration} seconds")
+        # The producer sends one message per tick; 5-second boundaries are tagged here
+        if interval == '1_SECOND' and second and second % 5 == 0:
+            interval = '5_SECOND'
         
         # Add to history
-        self.price_history.append(price)
-        self.time_history.append(second)
+        n = self._n_prices
+        if n < len(self._price_arr):
+            self._price_arr[n] = price
+            self._time_arr[n] = second
+        else:
+            self._price_arr.append(price)
+            self._time_arr.append(second)
+        self._n_prices = n + 1
         
         # Update candlestick aggregation and redraw
         if MATPLOTLIB_AVAILABLE and self.ax is not None:
             self.update_candlestick_data(second, price)
-            self.update_candlestick_chart()
+            # Decouple repaint rate from tick rate; always repaint when a candle closes
+            if self._candle_just_closed or second % self._plot_skip == 0:
+                self.schedule_redraw()
         
         # Log message
-        timestamp = datetime.now().strftime("%H:%M:%S")
+        timestamp = self.current_timestamp()
         log_line = f"[{timestamp}] [{interval}] Price: ${price:.2f}\n"
-        self.log_text.insert(tk.END, log_line)
-        self.log_text.see(tk.END)
+        self._pending_log.append(log_line)
+        
+    def update_price_display(self, data):
+        """Update price, progress and time labels with the latest tick."""
+        price = data['price']
+        second = data['second']
+        
+        # Update current price
+        self.current_price_var.set(f"${price:.2f}")
+        
+        # Update progress (bar maximum is the run duration)
+        self.progress_bar['value'] = second
+        self.progress_text_var.set(f"{second}/{self._duration} seconds")
         
         # Update simulation time
-        self.simulation_time_label.config(text=f"Last Update: {timestamp}")
+        timestamp = self.current_timestamp()
+        self.last_update_var.set(f"Last Update: {timestamp}")
         
     def on_simulation_complete(self):
         """Handle simulation completion."""
@@ -650,22 +835,51 @@ Range: ${data['high'] - data['low']:.2f}"""
         self.stop_button.config(state=tk.DISABLED)
         self.status_label.config(text="Simulation Complete")
         
-        # Draw the final candle state
+        # Draw the final candle state; closing it makes it part of the static chart
         if MATPLOTLIB_AVAILABLE and self.ax is not None:
-            self.update_candlestick_chart()
-            self.canvas.draw()
+            if self._cur_t is not None:
+                self.close_current_candle()
+            self.schedule_redraw()
         
         self.log_message("Simulation completed successfully")
         messagebox.showinfo("Simulation Complete", 
-                          f"Simulation completed!\nResults saved to: {self.output_file_var.get()}")
+                          f"Simulation completed!\nResults saved to: {self._output_file}")
         
     def log_message(self, message: str, level: str = "INFO"):
         """Add message to log display."""
-        timestamp = datetime.now().strftime("%H:%M:%S")
+        timestamp = self.current_timestamp()
         log_line = f"[{timestamp}] [{level}] {message}\n"
-        self.log_text.insert(tk.END, log_line)
+        self._pending_log.append(log_line)
+        self.flush_log()
+
+    def current_timestamp(self) -> str:
+        """Current wall-clock time as HH:MM:SS, formatted once per second."""
+        now = int(time.time())
+        if now != self._last_ts_sec:
+            self._last_ts_sec = now
+            self._last_ts_str = time.strftime("%H:%M:%S", time.localtime(now))
+        return self._last_ts_str
+
+    def flush_log(self):
+        """Insert pending log lines in one call and evict the oldest beyond the cap."""
+        if not self._pending_log:
+            return
+        self.log_text.insert(tk.END, "".join(self._pending_log))
+        self._log_lines += len(self._pending_log)
+        self._pending_log.clear()
+        
+        if self._log_lines > self._log_max:
+            excess = self._log_lines - self._log_max
+            self.log_text.delete("1.0", f"{excess + 1}.0")
+            self._log_lines = self._log_max
         self.log_text.see(tk.END)
 
+    def clear_log(self):
+        """Clear the log display."""
+        self._pending_log.clear()
+        self.log_text.delete(1.0, tk.END)
+        self._log_lines = 0
+
 
 def main():
     """Main entry point for the GUI application."""
@@ -10,14 +10,14 @@ import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
 import threading
 import time
-import json
-from datetime import datetime
 from pathlib import Path
-from typing import Dict, Any, Optional
-import queue
+from typing import Dict, Any, List, Optional
+from array import array
+from collections import deque
 
 # Try to import matplotlib for charting, fallback to text-based if not available
 try:
+    import numpy as np  # matplotlib hard-depends on numpy
     import matplotlib.pyplot as plt
     from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
     from matplotlib.figure import Figure
@@ -34,6 +34,13 @@ from faketrading import PriceSimulator
 class TradingSimulatorGUI:
     """Enhanced GUI application for the Fake Trading Price Simulator."""
     
+    # Minimum seconds between chart redraws; data is still recorded on every tick
+    MIN_FRAME_INTERVAL = 1 / 30
+    
+    # Statistics panel text, filled with one %-format per refresh
+    STATS_TEMPLATE = ("Current: $%.2f\nMin: $%.2f\nMax: $%.2f\nAvg: $%.2f\n"
+                      "Change: $%+.2f (%+.2f%%)")
+    
     def __init__(self, root):
         self.root = root
         self.root.title("Fake Trading Price Simulator - Enhanced GUI")
@@ -44,10 +51,14 @@ class TradingSimulatorGUI:
         self.simulator: Optional[PriceSimulator] = None
         self.simulation_thread: Optional[threading.Thread] = None
         self.is_running = False
-        self.pause_simulation = False
+        # Worker signalling: stop wakes any wait immediately; resume is cleared while paused
+        self._stop_event = threading.Event()
+        self._resume_event = threading.Event()
+        self._resume_event.set()
         
-        # Data queue for thread communication
-        self.data_queue = queue.Queue()
+        # Data queue for thread communication (single producer/consumer;
+        # deque append/popleft are atomic, so no extra locking is needed)
+        self.data_queue = deque()
         
         # GUI variables
         self.volatility_var = tk.DoubleVar(value=0.5)
@@ -56,10 +67,14 @@ class TradingSimulatorGUI:
         self.output_file_var = tk.StringVar(value="simulation_results.json")
         self.log_level_var = tk.StringVar(value="INFO")
         self.chart_type_var = tk.StringVar(value="Candlestick")
-        
-        # Price history for plotting
-        self.price_history = []
-        self.time_history = []
+        # Label text for frequently updated displays; setting a variable is cheaper than Label.config
+        self.volatility_text_var = tk.StringVar(value="0.5")
+        self.current_price_var = tk.StringVar(value="$0.00")
+        self.progress_text_var = tk.StringVar(value="0/60 seconds")
+        self.last_update_var = tk.StringVar(value="")
+        
+        # Price history: compact typed arrays, preallocated for the run length at start
+        self.reset_history()
         self.candlestick_data = []  # Store OHLC data for candlesticks
         self.current_candle = None  # Current candle being built
         
@@ -68,6 +83,32 @@ class TradingSimulatorGUI:
         self.canvas = None
         self.ax = None
         
+        # Line chart blitting: animated line, cached background and the limits it was drawn with
+        self.line = None
+        self._bg = None
+        self._line_limits = None
+        # Set when new data has not been drawn yet; redraws are throttled to MIN_FRAME_INTERVAL
+        self._chart_dirty = False
+        self._last_draw_t = 0.0
+        # Latest price update not yet shown, and whether a render() is already queued
+        self._latest_update = None
+        self._render_pending = False
+        
+        # Log display is capped at _log_max lines; lines from one display tick are inserted together
+        self._pending_log: List[str] = []
+        self._log_lines = 0
+        self._log_max = 1000
+        # Lines currently in the text chart (used when matplotlib is unavailable)
+        self._chart_lines = 0
+        self._last_timestamp = ""
+        
+        # Validated market data, cached by (path, modification time)
+        self._market_data: Dict[str, float] = {}
+        self._market_data_key = None
+        
+        # Pending after() id for the debounced volatility log line
+        self._volatility_log_after = None
+        
         self.setup_gui()
         self.setup_bindings()
         
@@ -109,7 +150,7 @@ class TradingSimulatorGUI:
         volatility_scale = ttk.Scale(params_frame, from_=0.0, to=2.0, 
                                    variable=self.volatility_var, orient=tk.HORIZONTAL)
         volatility_scale.grid(row=0, column=1, sticky=(tk.W, tk.E), padx=(5, 0), pady=2)
-        self.volatility_label = ttk.Label(params_frame, text="0.5")
+        self.volatility_label = ttk.Label(params_frame, textvariable=self.volatility_text_var)
         self.volatility_label.grid(row=0, column=2, padx=(5, 0))
         
                 # Duration
@@ -193,7 +234,7 @@ class TradingSimulatorGUI:
         price_frame.pack(fill=tk.X, pady=(0, 10))
         
         ttk.Label(price_frame, text="Current Price:", font=("Arial", 12, "bold")).pack(side=tk.LEFT)
-        self.current_price_label = ttk.Label(price_frame, text="$0.00", 
+        self.current_price_label = ttk.Label(price_frame, textvariable=self.current_price_var, 
                                            font=("Arial", 16, "bold"), foreground="green")
         self.current_price_label.pack(side=tk.LEFT, padx=(10, 0))
         
@@ -204,7 +245,7 @@ class TradingSimulatorGUI:
         ttk.Label(progress_frame, text="Progress:").pack(side=tk.LEFT)
         self.progress_bar = ttk.Progressbar(progress_frame, mode='determinate', length=300)
         self.progress_bar.pack(side=tk.LEFT, padx=(10, 0), fill=tk.X, expand=True)
-        self.progress_label = ttk.Label(progress_frame, text="0/60 seconds")
+        self.progress_label = ttk.Label(progress_frame, textvariable=self.progress_text_var)
         self.progress_label.pack(side=tk.LEFT, padx=(10, 0))
         
         # Chart Display
@@ -239,6 +280,8 @@ class TradingSimulatorGUI:
         
         # Create canvas
         self.canvas = FigureCanvasTkAgg(self.figure, chart_frame)
+        # Re-capture the blit background after every full draw (first show, resize, limit change)
+        self.canvas.mpl_connect('draw_event', self.on_chart_draw)
         self.canvas.draw()
         self.canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
         
@@ -262,7 +305,7 @@ class TradingSimulatorGUI:
         self.status_label = ttk.Label(status_frame, text="Ready")
         self.status_label.pack(side=tk.LEFT)
         
-        self.simulation_time_label = ttk.Label(status_frame, text="")
+        self.simulation_time_label = ttk.Label(status_frame, textvariable=self.last_update_var)
         self.simulation_time_label.pack(side=tk.RIGHT)
         
     def setup_bindings(self):
@@ -297,33 +340,54 @@ class TradingSimulatorGUI:
         """Load and display market data."""
         try:
             data_file = self.data_file_var.get()
-            if Path(data_file).exists():
-                with open(data_file, 'r') as f:
-                    data = json.load(f)
-                
-                # Display market data
-                market_info = f"""Open: ${data['open']:.2f}
+            # get_market_data stats the file once; a missing file surfaces here
+            data = self.get_market_data(data_file)
+            
+            # Display market data
+            market_info = f"""Open: ${data['open']:.2f}
 High: ${data['high']:.2f}
 Low: ${data['low']:.2f}
 Close: ${data['close']:.2f}
 Range: ${data['high'] - data['low']:.2f}"""
-                
-                self.market_data_text.delete(1.0, tk.END)
-                self.market_data_text.insert(1.0, market_info)
-                
-                # Update current price
-                self.current_price_label.config(text=f"${data['open']:.2f}")
-                
-                self.log_message("Market data loaded successfully")
-            else:
-                self.log_message(f"Data file not found: {data_file}", "ERROR")
+            
+            self.market_data_text.delete(1.0, tk.END)
+            self.market_data_text.insert(1.0, market_info)
+            
+            # Update current price
+            self.current_price_var.set(f"${data['open']:.2f}")
+            
+            self.log_message("Market data loaded successfully")
+        except FileNotFoundError:
+            self.log_message(f"Data file not found: {data_file}", "ERROR")
         except Exception as e:
             self.log_message(f"Error loading market data: {e}", "ERROR")
             
+    def get_market_data(self, data_file: str) -> Dict[str, float]:
+        """
+        Return validated market data for data_file, parsing it only when the file changed.
+        
+        SAFETY: Parsing goes through PriceSimulator.load_market_data, so the cached
+        dict has passed the same validation the simulation relies on
+        """
+        key = (data_file, Path(data_file).stat().st_mtime_ns)
+        if key != self._market_data_key:
+            self._market_data = PriceSimulator(data_file=data_file).load_market_data()
+            self._market_data_key = key
+        return self._market_data
+        
     def on_volatility_change(self, *args):
         """Handle volatility change."""
         volatility = self.volatility_var.get()
-        self.volatility_label.config(text=f"{volatility:.2f}")
+        self.volatility_text_var.set(f"{volatility:.2f}")
+        
+        # Dragging the slider fires this per pixel; only log the value it settles on
+        if self._volatility_log_after is not None:
+            self.root.after_cancel(self._volatility_log_after)
+        self._volatility_log_after = self.root.after(150, self.log_volatility, volatility)
+        
+    def log_volatility(self, volatility: float):
+        """Log a volatility change once the slider has settled."""
+        self._volatility_log_after = None
         self.log_message(f"Volatility changed to: {volatility:.2f}")
         
     def start_simulation(self):
@@ -337,26 +401,31 @@ Range: ${data['high'] - data['low']:.2f}"""
                 volatility=self.volatility_var.get(),
                 data_file=self.data_file_var.get()
             )
+            # Hand over the already parsed data so the worker does not read the file again
+            self.simulator.market_data = self.get_market_data(self.simulator.data_file)
             
-            # Clear previous data
-            self.price_history = []
-            self.time_history = []
+            # Clear previous data (one update per second, a repeat every 5 seconds,
+            # plus the opening and closing updates)
+            duration = self.duration_var.get()
+            self.reset_history(duration + duration // 5 + 2)
             self.candlestick_data = []
             self.current_candle = None
             if MATPLOTLIB_AVAILABLE:
-                self.ax.clear()
-                self.ax.set_title("Real-time Price Movement")
-                self.ax.set_xlabel("Time (seconds)")
-                self.ax.set_ylabel("Price ($)")
-                self.ax.grid(True, alpha=0.3)
-                self.canvas.draw()
+                self.clear_chart()
             else:
                 self.chart_text.delete(1.0, tk.END)
+                self._chart_lines = 0
             self.log_text.delete(1.0, tk.END)
+            self._log_lines = 0
             
-            # Start simulation thread
+            # Start simulation thread. A thread, not a process, on purpose: the
+            # worker computes the whole price path in one batch call and then
+            # mostly waits, so it barely competes with Tk for the GIL, while a
+            # separate process would add pickling/IPC for every tick and lose
+            # the shared simulator state read by the chart code
             self.is_running = True
-            self.pause_simulation = False
+            self._stop_event.clear()
+            self._resume_event.set()
             self.simulation_thread = threading.Thread(target=self.run_simulation_thread)
             self.simulation_thread.daemon = True
             self.simulation_thread.start()
@@ -376,88 +445,90 @@ Range: ${data['high'] - data['low']:.2f}"""
     def run_simulation_thread(self):
         """Run simulation in separate thread."""
         try:
-            # Load market data
-            market_data = self.simulator.load_market_data()
+            # Market data is normally handed over by start_simulation
+            market_data = self.simulator.market_data or self.simulator.load_market_data()
             self.simulator.current_price = market_data["open"]
             
             # Send initial data
-            self.data_queue.put({
+            self.data_queue.append({
                 'type': 'price_update',
                 'price': self.simulator.current_price,
                 'second': 0,
-                'interval': '1_SECOND'
+                'interval': '1_SECOND',
+                'ts': time.strftime("%H:%M:%S")
             })
             
             # Run simulation
             duration = self.duration_var.get()
-            start_time = time.time()
+            # Generate the whole path up front; the loop below only paces delivery
+            prices = self.simulator.generate_prices_batch(duration)
+            start_time = time.monotonic()
             
             for second in range(1, duration + 1):
-                if not self.is_running:
-                    break
-                    
-                # Wait for pause to be released
-                while self.pause_simulation and self.is_running:
-                    time.sleep(0.1)
-                    
-                if not self.is_running:
+                # Block while paused; stop_simulation also releases this wait
+                self._resume_event.wait()
+                if self._stop_event.is_set():
                     break
                     
-                # Generate next price
-                self.simulator.current_price = self.simulator.generate_price(second, duration)
+                # Next price from the precomputed path
+                self.simulator.current_price = prices[second - 1]
                 
-                # Send data to GUI
-                self.data_queue.put({
+                # Send data to GUI; the timestamp is formatted here, off the Tk thread
+                ts = time.strftime("%H:%M:%S")
+                self.data_queue.append({
                     'type': 'price_update',
                     'price': self.simulator.current_price,
                     'second': second,
-                    'interval': '1_SECOND'
+                    'interval': '1_SECOND',
+                    'ts': ts
                 })
                 
                 # Log at intervals
                 if second % 5 == 0:
-                    self.data_queue.put({
+                    self.data_queue.append({
                         'type': 'price_update',
                         'price': self.simulator.current_price,
                         'second': second,
-                        'interval': '5_SECOND'
+                        'interval': '5_SECOND',
+                        'ts': ts
                     })
                 
-                # Sleep for 1 second
-                elapsed = time.time() - start_time
-                target_elapsed = second
-                if elapsed < target_elapsed:
-                    time.sleep(target_elapsed - elapsed)
+                # Wait until this second's deadline; wakes immediately on stop
+                remaining = start_time + second - time.monotonic()
+                if remaining > 0 and self._stop_event.wait(remaining):
+                    break
                     
             # Final price (convergence)
             self.simulator.current_price = market_data["close"]
-            self.data_queue.put({
+            self.data_queue.append({
                 'type': 'price_update',
                 'price': self.simulator.current_price,
                 'second': duration,
-                'interval': '1_MINUTE'
+                'interval': '1_MINUTE',
+                'ts': time.strftime("%H:%M:%S")
             })
             
             # Export results
             self.simulator.export_results(self.output_file_var.get())
             
             # Send completion signal
-            self.data_queue.put({'type': 'simulation_complete'})
+            self.data_queue.append({'type': 'simulation_complete'})
             
         except Exception as e:
-            self.data_queue.put({
+            self.data_queue.append({
                 'type': 'error',
                 'message': str(e)
             })
             
     def pause_simulation_toggle(self):
         """Toggle simulation pause."""
-        self.pause_simulation = not self.pause_simulation
-        if self.pause_simulation:
+        if self._resume_event.is_set():
+            self._resume_event.clear()
             self.pause_button.config(text="Resume")
             self.status_label.config(text="Simulation Paused")
             self.log_message("Simulation paused")
         else:
+            self._resume_event.set()
             self.pause_button.config(text="Pause")
             self.status_label.config(text="Simulation Running")
             self.log_message("Simulation resumed")
@@ -465,7 +536,8 @@ Range: ${data['high'] - data['low']:.2f}"""
     def stop_simulation(self):
         """Stop the simulation."""
         self.is_running = False
-        self.pause_simulation = False
+        self._stop_event.set()
+        self._resume_event.set()
         
         # Update UI
         self.start_button.config(state=tk.NORMAL)
@@ -477,116 +549,259 @@ Range: ${data['high'] - data['low']:.2f}"""
         
     def reset_simulation(self):
         """Reset the simulation display."""
-        self.price_history = []
-        self.time_history = []
+        self.reset_history()
         
         if MATPLOTLIB_AVAILABLE:
-            self.ax.clear()
-            self.ax.set_title("Real-time Price Movement")
-            self.ax.set_xlabel("Time (seconds)")
-            self.ax.set_ylabel("Price ($)")
-            self.ax.grid(True, alpha=0.3)
-            self.canvas.draw()
+            self.clear_chart()
         else:
             self.chart_text.delete(1.0, tk.END)
+            self._chart_lines = 0
             
         self.log_text.delete(1.0, tk.END)
-        self.current_price_label.config(text="$0.00")
+        self._log_lines = 0
+        self.current_price_var.set("$0.00")
         self.progress_bar['value'] = 0
-        self.progress_label.config(text="0/60 seconds")
+        self.progress_text_var.set("0/60 seconds")
         self.status_label.config(text="Ready")
-        self.simulation_time_label.config(text="")
+        self.last_update_var.set("")
         
         # Clear statistics
         self.stats_text.delete(1.0, tk.END)
         
         self.log_message("Display reset")
         
+    def reset_history(self, capacity: int = 0):
+        """Drop the price history and preallocate room for the next run."""
+        self._price_arr = array('d', [0.0]) * capacity
+        self._time_arr = array('i', [0]) * capacity
+        self._cursor = 0
+        # Running statistics, updated per price so the stats panel is O(1)
+        self._first_price = 0.0
+        self._min_price = 0.0
+        self._max_price = 0.0
+        self._price_sum = 0.0
+        # A frame still pending for the dropped history must not be drawn
+        self._chart_dirty = False
+        
+    def append_history(self, second: int, price: float):
+        """Record one price update."""
+        n = self._cursor
+        if n == len(self._price_arr):
+            # Swap in larger buffers instead of resizing in place: chart artists may
+            # still hold numpy views of the old ones
+            extra = max(n, 16)
+            self._price_arr = self._price_arr + array('d', [0.0]) * extra
+            self._time_arr = self._time_arr + array('i', [0]) * extra
+        self._price_arr[n] = price
+        self._time_arr[n] = second
+        self._cursor = n + 1
+        
+        if n == 0:
+            self._first_price = self._min_price = self._max_price = price
+        elif price < self._min_price:
+            self._min_price = price
+        elif price > self._max_price:
+            self._max_price = price
+        self._price_sum += price
+        
+    def history_arrays(self):
+        """Zero-copy numpy views of the recorded times and prices."""
+        n = self._cursor
+        return (np.frombuffer(self._time_arr, dtype=np.intc, count=n),
+                np.frombuffer(self._price_arr, count=n))
+        
+    @property
+    def price_history(self) -> List[float]:
+        """Prices received so far, oldest first."""
+        return self._price_arr[:self._cursor].tolist()
+        
+    @property
+    def time_history(self) -> List[int]:
+        """Simulation seconds matching price_history."""
+        return self._time_arr[:self._cursor].tolist()
+        
     def update_display(self):
         """Update the display with data from the simulation thread."""
-        try:
-            while True:
-                data = self.data_queue.get_nowait()
-                
-                if data['type'] == 'price_update':
-                    self.update_price_display(data)
-                elif data['type'] == 'simulation_complete':
+        # Drain everything queued since the last tick; every price is recorded,
+        # but the widgets are refreshed once, from the latest, by render()
+        while self.data_queue:
+            data = self.data_queue.popleft()
+            
+            if data['type'] == 'price_update':
+                self.record_price(data)
+                self._latest_update = data
+            else:
+                # Widgets show everything that came before completion or an error
+                self.render()
+                if data['type'] == 'simulation_complete':
                     self.on_simulation_complete()
                 elif data['type'] == 'error':
                     messagebox.showerror("Simulation Error", data['message'])
                     self.stop_simulation()
-                    
-        except queue.Empty:
-            pass
+        
+        if self._latest_update is not None or self._pending_log or self._chart_dirty:
+            self.schedule_render()
         
         # Schedule next update
         self.root.after(100, self.update_display)
         
-    def update_price_display(self, data):
-        """Update price display with new data."""
+    def record_price(self, data):
+        """Record one tick: history, candle aggregation and log line."""
         price = data['price']
         second = data['second']
         interval = data['interval']
         
+        # Add to history
+        self.append_history(second, price)
+        
+        # Update candlestick data
+        self.update_candlestick_data(second, price)
+        
+        if not MATPLOTLIB_AVAILABLE:
+            self.update_text_chart(second, interval, price)
+        
+        # Log message
+        timestamp = data['ts']
+        self._pending_log.append(f"[{timestamp}] [{interval}] Price: ${price:.2f}\n")
+        self._last_timestamp = timestamp
+        
+    def update_price_display(self, data):
+        """Refresh labels, chart and statistics from the latest tick."""
+        price = data['price']
+        second = data['second']
+        
         # Update current price
-        self.current_price_label.config(text=f"${price:.2f}")
+        self.current_price_var.set(f"${price:.2f}")
         
         # Update progress
         duration = self.duration_var.get()
         progress = (second / duration) * 100
         self.progress_bar['value'] = progress
-        self.progress_label.config(text=f"{second}/{duration} seconds")
+        self.progress_text_var.set(f"{second}/{duration} seconds")
         
-        # Add to history
-        self.price_history.append(price)
-        self.time_history.append(second)
+        # Update simulation time
+        self.last_update_var.set(f"Last Update: {self._last_timestamp}")
         
-        # Update candlestick data
-        self.update_candlestick_data(second, price)
+        # Chart and statistics need at least two points
+        if self._cursor < 2:
+            return
         
-        # Update chart
-        if MATPLOTLIB_AVAILABLE:
-            chart_type = self.chart_type_var.get()
-            if chart_type == "Candlestick":
-                self.update_candlestick_chart()
-            elif chart_type == "Area":
-                self.update_area_chart()
-            else:
-                self.update_line_chart()
+        # Chart is redrawn by refresh_chart at the end of the display tick
+        self._chart_dirty = MATPLOTLIB_AVAILABLE
+        
+        # Update statistics
+        self.update_statistics()
+        
+    def schedule_render(self):
+        """Queue a single idle-time pass that applies pending updates to the widgets."""
+        if not self._render_pending:
+            self._render_pending = True
+            self.root.after_idle(self.render)
+            
+    def render(self):
+        """Apply the latest tick to the labels, statistics, log and chart in one pass."""
+        self._render_pending = False
+        latest, self._latest_update = self._latest_update, None
+        if latest is not None:
+            self.update_price_display(latest)
+        self.flush_log()
+        self.refresh_chart()
+        
+    def refresh_chart(self):
+        """Redraw the chart from the latest data, at most once per MIN_FRAME_INTERVAL."""
+        if not self._chart_dirty:
+            return
+        now = time.monotonic()
+        if now - self._last_draw_t < self.MIN_FRAME_INTERVAL:
+            # Skipped frames are not lost: the next tick draws the latest data
+            return
+        self._last_draw_t = now
+        self._chart_dirty = False
+        
+        chart_type = self.chart_type_var.get()
+        if chart_type == "Candlestick":
+            self.update_candlestick_chart()
+        elif chart_type == "Area":
+            self.update_area_chart()
         else:
-            self.update_text_chart(second, interval, price)
+            self.update_line_chart()
         
-        # Log message
-        timestamp = datetime.now().strftime("%H:%M:%S")
-        log_line = f"[{timestamp}] [{interval}] Price: ${price:.2f}\n"
-        self.log_text.insert(tk.END, log_line)
+    def flush_log(self):
+        """Insert pending log lines in one call and evict the oldest beyond the cap."""
+        if not self._pending_log:
+            return
+        self.log_text.insert(tk.END, "".join(self._pending_log))
+        self._log_lines += len(self._pending_log)
+        self._pending_log.clear()
+        
+        if self._log_lines > self._log_max:
+            excess = self._log_lines - self._log_max
+            self.log_text.delete("1.0", f"{excess + 1}.0")
+            self._log_lines = self._log_max
         self.log_text.see(tk.END)
         
-        # Update simulation time
-        self.simulation_time_label.config(text=f"Last Update: {timestamp}")
+    def on_chart_draw(self, event):
+        """Cache the axes background after a full draw and paint the animated line on top."""
+        if self.line is not None:
+            self._bg = self.canvas.copy_from_bbox(self.ax.bbox)
+            self.ax.draw_artist(self.line)
+            
+    def setup_line_artist(self):
+        """Reset the axes for the line chart and create its animated line."""
+        self.ax.clear()
+        self.ax.set_title("Real-time Price Movement")
+        self.ax.set_xlabel("Time (seconds)")
+        self.ax.set_ylabel("Price ($)")
+        self.ax.grid(True, alpha=0.3)
         
-        # Update statistics
-        self.update_statistics()
+        # Excluded from full draws; blitted over the cached background instead
+        self.line, = self.ax.plot([], [], 'b-', linewidth=2, animated=True)
+        self._bg = None
+        self._line_limits = None
+        
+    def clear_chart(self):
+        """Empty the chart, keeping the line artist and its axes if the line chart is shown."""
+        if self.line is not None:
+            self.line.set_data([], [])
+        else:
+            self.setup_line_artist()
+        # draw_event re-captures the background once the idle draw runs
+        self.canvas.draw_idle()
         
     def update_matplotlib_chart(self):
-        """Update matplotlib chart."""
-        if len(self.price_history) > 1:
-            self.ax.clear()
-            self.ax.plot(self.time_history, self.price_history, 'b-', linewidth=2)
-            self.ax.set_title("Real-time Price Movement")
-            self.ax.set_xlabel("Time (seconds)")
-            self.ax.set_ylabel("Price ($)")
-            self.ax.grid(True, alpha=0.3)
-            
-            # Set y-axis limits based on market data
-            if hasattr(self, 'simulator') and self.simulator.market_data:
-                low = self.simulator.market_data['low']
-                high = self.simulator.market_data['high']
-                margin = (high - low) * 0.1
-                self.ax.set_ylim(low - margin, high + margin)
-            
-            self.canvas.draw()
-            
+        """Update the line chart by blitting the line over the cached background."""
+        if self.line is None:
+            self.setup_line_artist()
+        times, prices = self.history_arrays()
+        self.line.set_data(times, prices)
+        
+        # Limits: x spans the run, y comes from market data; a change needs a full draw
+        xmax = max(self.duration_var.get(), int(times[-1]))
+        ylim = None
+        if self.simulator and self.simulator.market_data:
+            low = self.simulator.market_data['low']
+            high = self.simulator.market_data['high']
+            margin = (high - low) * 0.1
+            ylim = (low - margin, high + margin)
+        limits = (xmax, ylim)
+        if limits != self._line_limits:
+            self.ax.set_xlim(0, xmax)
+            if ylim is not None:
+                self.ax.set_ylim(*ylim)
+            self._line_limits = limits
+            self._bg = None
+        
+        if self._bg is None:
+            # Deferred full draw; draw_event re-captures the background and paints the line
+            self.canvas.draw_idle()
+            return
+        # Per-tick fast path: no full render, only the line's region is repainted.
+        # No flush_events()/update() here: this runs from an after() callback and
+        # the Tk main loop shows the blitted image on its own
+        self.canvas.restore_region(self._bg)
+        self.ax.draw_artist(self.line)
+        self.canvas.blit(self.ax.bbox)
+        
     def update_candlestick_data(self, second, price):
         """Update candlestick data with new price."""
         # Create new candle every 5 seconds (or adjust as needed)
@@ -617,6 +832,7 @@ Range: ${data['high'] - data['low']:.2f}"""
         """Update candlestick chart."""
         if len(self.candlestick_data) > 0:
             self.ax.clear()
+            self.line = None
             
             # Include the current candle if it exists (even after completion)
             if self.current_candle is not None:
@@ -647,7 +863,7 @@ Range: ${data['high'] - data['low']:.2f}"""
                 margin = (high - low) * 0.1
                 self.ax.set_ylim(low - margin, high + margin)
             
-            self.canvas.draw()
+            self.canvas.draw_idle()
             
     def plot_candlesticks(self, times, opens, highs, lows, closes):
         """Plot candlestick patterns."""
@@ -680,43 +896,29 @@ Range: ${data['high'] - data['low']:.2f}"""
                 
     def update_line_chart(self):
         """Update line chart."""
-        if len(self.price_history) > 1:
-            self.ax.clear()
-            self.ax.plot(self.time_history, self.price_history, 'b-', linewidth=2)
-            self.ax.set_title("Real-time Price Movement")
-            self.ax.set_xlabel("Time (seconds)")
-            self.ax.set_ylabel("Price ($)")
-            self.ax.grid(True, alpha=0.3)
-            
-            # Set y-axis limits based on market data
-            if hasattr(self, 'simulator') and self.simulator.market_data:
-                low = self.simulator.market_data['low']
-                high = self.simulator.market_data['high']
-                margin = (high - low) * 0.1
-                self.ax.set_ylim(low - margin, high + margin)
-            
-            self.canvas.draw()
+        self.update_matplotlib_chart()
             
     def update_area_chart(self):
         """Update area chart."""
-        if len(self.price_history) > 1:
-            self.ax.clear()
-            self.ax.fill_between(self.time_history, self.price_history, alpha=0.6, color='blue')
-            self.ax.plot(self.time_history, self.price_history, 'b-', linewidth=2)
-            self.ax.set_title("Real-time Price Movement (Area)")
-            self.ax.set_xlabel("Time (seconds)")
-            self.ax.set_ylabel("Price ($)")
-            self.ax.grid(True, alpha=0.3)
-            
-            # Set y-axis limits based on market data
-            if hasattr(self, 'simulator') and self.simulator.market_data:
-                low = self.simulator.market_data['low']
-                high = self.simulator.market_data['high']
-                margin = (high - low) * 0.1
-                self.ax.set_ylim(low - margin, high + margin)
-            
-            self.canvas.draw()
-            
+        self.ax.clear()
+        self.line = None
+        times, prices = self.history_arrays()
+        self.ax.fill_between(times, prices, alpha=0.6, color='blue')
+        self.ax.plot(times, prices, 'b-', linewidth=2)
+        self.ax.set_title("Real-time Price Movement (Area)")
+        self.ax.set_xlabel("Time (seconds)")
+        self.ax.set_ylabel("Price ($)")
+        self.ax.grid(True, alpha=0.3)
+        
+        # Set y-axis limits based on market data
+        if hasattr(self, 'simulator') and self.simulator.market_data:
+            low = self.simulator.market_data['low']
+            high = self.simulator.market_data['high']
+            margin = (high - low) * 0.1
+            self.ax.set_ylim(low - margin, high + margin)
+        
+        self.canvas.draw_idle()
+        
     def update_text_chart(self, second, interval, price):
         """Update text-based chart."""
         chart_line = f"[{second:3d}s] {interval:10s} ${price:8.2f}"
@@ -724,36 +926,29 @@ Range: ${data['high'] - data['low']:.2f}"""
         self.chart_text.see(tk.END)
         
         # Keep only last 50 lines
-        lines = self.chart_text.get(1.0, tk.END).split('\n')
-        if len(lines) > 50:
-            self.chart_text.delete(1.0, tk.END)
-            self.chart_text.insert(1.0, '\n'.join(lines[-50:]))
+        self._chart_lines += 1
+        if self._chart_lines > 50:
+            self.chart_text.delete("1.0", "2.0")
+            self._chart_lines -= 1
             
     def update_statistics(self):
-        """Update statistics display."""
-        if len(self.price_history) > 1:
-            current_price = self.price_history[-1]
-            min_price = min(self.price_history)
-            max_price = max(self.price_history)
-            avg_price = sum(self.price_history) / len(self.price_history)
-            
-            # Calculate price change
-            if len(self.price_history) > 1:
-                price_change = current_price - self.price_history[0]
-                price_change_pct = (price_change / self.price_history[0]) * 100
-            else:
-                price_change = 0
-                price_change_pct = 0
-            
-            stats_info = f"""Current: ${current_price:.2f}
-Min: ${min_price:.2f}
-Max: ${max_price:.2f}
-Avg: ${avg_price:.2f}
-Change: ${price_change:+.2f} ({price_change_pct:+.2f}%)"""
-            
-            self.stats_text.delete(1.0, tk.END)
-            self.stats_text.insert(1.0, stats_info)
-            
+        """Update statistics display (called once at least two prices are recorded)."""
+        n = self._cursor
+        current_price = self._price_arr[n - 1]
+        min_price = self._min_price
+        max_price = self._max_price
+        avg_price = self._price_sum / n
+        
+        # Calculate price change
+        price_change = current_price - self._first_price
+        price_change_pct = (price_change / self._first_price) * 100
+        
+        stats_info = self.STATS_TEMPLATE % (current_price, min_price, max_price, avg_price,
+                                            price_change, price_change_pct)
+        
+        self.stats_text.delete(1.0, tk.END)
+        self.stats_text.insert(1.0, stats_info)
+        
     def on_simulation_complete(self):
         """Handle simulation completion."""
         self.is_running = False
@@ -770,10 +965,10 @@ Change: ${price_change:+.2f} ({price_change_pct:+.2f}%)"""
         
     def log_message(self, message: str, level: str = "INFO"):
         """Add message to log display."""
-        timestamp = datetime.now().strftime("%H:%M:%S")
-        log_line = f"[{timestamp}] [{level}] {message}\n"
-        self.log_text.insert(tk.END, log_line)
-        self.log_text.see(tk.END)
+        timestamp = time.strftime("%H:%M:%S")
+        # Queued behind any pending tick lines so the log stays in order
+        self._pending_log.append(f"[{timestamp}] [{level}] {message}\n")
+        self.flush_log()
 
 
 def main():
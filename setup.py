@@ -9,18 +9,78 @@ SAFETY: Ensures all required files and permissions are correct
 import sys
 import json
 import os
+import importlib.util
+import stat
 import subprocess
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Tuple, Any
+from typing import Dict, List, Optional, Tuple, Any
+
+# Use orjson for faster JSON parsing when available
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Market data from a successful validate_data_file, reused by run_quick_test
+_validated_market_data: Optional[Dict[str, float]] = None
+
+# Output lines queued by emit() and written to stdout together by flush_output()
+_output: List[str] = []
+
+# Per-thread output buffer set by _run_check so concurrent checks don't interleave
+_local = threading.local()
+
+
+def emit(message: str = "") -> None:
+    """Queue one line of setup output (into the running check's buffer, if any)."""
+    getattr(_local, "output", _output).append(message)
+
+
+def flush_output() -> None:
+    """Write all queued output lines in a single call."""
+    if _output:
+        sys.stdout.write("\n".join(_output) + "\n")
+        sys.stdout.flush()
+        _output.clear()
+
+
+@lru_cache(maxsize=8)
+def _parse_json_file(path: str, mtime_ns: int, size: int) -> Dict[str, Any]:
+    """Parse a JSON file; mtime and size only key the cache so edits are picked up."""
+    raw = Path(path).read_bytes()
+    return orjson.loads(raw) if ORJSON_AVAILABLE else json.loads(raw)
+
+
+def _load_json_cached(entry: os.DirEntry) -> Dict[str, Any]:
+    """Load a JSON file, reusing the parsed result while the file is unchanged."""
+    # A fresh stat, not the entry's cached one, so edits change the cache key
+    st = os.stat(entry.path)
+    return _parse_json_file(entry.path, st.st_mtime_ns, st.st_size)
+
+
+@lru_cache(maxsize=1)
+def _directory_entries() -> Dict[str, os.DirEntry]:
+    """Snapshot of the current directory, scanned once and shared by all checks."""
+    with os.scandir('.') as entries:
+        return {entry.name: entry for entry in entries}
+
+
+def _is_readable(entry: os.DirEntry) -> bool:
+    """Owner read permission, from the entry's cached stat."""
+    return bool(entry.stat().st_mode & stat.S_IRUSR)
 
 
 def check_python_version() -> bool:
     """Check if Python version meets requirements."""
     if sys.version_info < (3, 7):
-        print("❌ Python 3.7 or higher is required")
-        print(f"   Current version: {sys.version}")
+        emit("❌ Python 3.7 or higher is required")
+        emit(f"   Current version: {sys.version}")
         return False
-    print(f"✅ Python version: {sys.version.split()[0]}")
+    emit(f"✅ Python version: {sys.version.split()[0]}")
     return True
 
 
@@ -31,132 +91,156 @@ def check_required_modules() -> bool:
         'datetime', 'pathlib', 'sys', 'typing'
     ]
     
-    missing_modules = []
-    for module in required_modules:
-        try:
-            __import__(module)
-        except ImportError:
-            missing_modules.append(module)
+    # Already-imported modules are found by a dict lookup; the rest are
+    # located with find_spec, which does not execute them
+    missing_modules = [
+        module for module in required_modules
+        if module not in sys.modules and importlib.util.find_spec(module) is None
+    ]
     
     if missing_modules:
-        print(f"❌ Missing required modules: {missing_modules}")
+        emit(f"❌ Missing required modules: {missing_modules}")
         return False
     
-    print("✅ All required modules available")
+    emit("✅ All required modules available")
     return True
 
 
+# Keys and value types every data.json must provide
+PRICE_KEYS = ("open", "high", "low", "close")
+NUMERIC_TYPES = (int, float)
+
+
+def _market_data_error(data: Dict[str, Any]) -> Optional[str]:
+    """Return a message describing why market data is invalid, or None if it is valid."""
+    # Check required keys
+    required_keys = set(PRICE_KEYS)
+    if not required_keys.issubset(data.keys()):
+        missing = required_keys - data.keys()
+        return f"Missing required keys in data.json: {missing}"
+    
+    # Check numeric types
+    for key in required_keys:
+        if not isinstance(data[key], NUMERIC_TYPES):
+            return f"Value for '{key}' must be numeric, got {type(data[key])}"
+    
+    # Check logical constraints
+    if data["high"] < data["low"]:
+        return f"High price ({data['high']}) cannot be less than low price ({data['low']})"
+    
+    if data["open"] < data["low"] or data["open"] > data["high"]:
+        return f"Open price ({data['open']}) must be within low-high range"
+    
+    if data["close"] < data["low"] or data["close"] > data["high"]:
+        return f"Close price ({data['close']}) must be within low-high range"
+    
+    return None
+
+
 def validate_data_file() -> bool:
     """Validate the data.json file structure and content."""
+    global _validated_market_data
+    _validated_market_data = None
     data_file = Path("data.json")
     
-    if not data_file.exists():
-        print("❌ data.json file not found")
+    entry = _directory_entries().get(data_file.name)
+    
+    if entry is None:
+        emit("❌ data.json file not found")
+        return False
+    
+    # Check if file is readable
+    if not _is_readable(entry):
+        emit("❌ data.json is not readable")
         return False
     
     try:
-        with open(data_file, 'r') as f:
-            data = json.load(f)
+        data = _load_json_cached(entry)
         
-        # Check required keys
-        required_keys = {"open", "high", "low", "close"}
-        if not required_keys.issubset(data.keys()):
-            missing = required_keys - data.keys()
-            print(f"❌ Missing required keys in data.json: {missing}")
-            return False
+        o, h, l, c = (data.get(key) for key in PRICE_KEYS) if isinstance(data, dict) else (None,) * 4
         
-        # Check numeric types
-        for key in required_keys:
-            if not isinstance(data[key], (int, float)):
-                print(f"❌ Value for '{key}' must be numeric, got {type(data[key])}")
+        # Fast path: a single compound test; the step-by-step checks only run to explain a failure
+        if not (type(o) in NUMERIC_TYPES and type(h) in NUMERIC_TYPES
+                and type(l) in NUMERIC_TYPES and type(c) in NUMERIC_TYPES
+                and l <= h and l <= o <= h and l <= c <= h):
+            error = _market_data_error(data)
+            if error:
+                emit(f"❌ {error}")
                 return False
         
-        # Check logical constraints
-        if data["high"] < data["low"]:
-            print(f"❌ High price ({data['high']}) cannot be less than low price ({data['low']})")
-            return False
-        
-        if data["open"] < data["low"] or data["open"] > data["high"]:
-            print(f"❌ Open price ({data['open']}) must be within low-high range")
-            return False
-        
-        if data["close"] < data["low"] or data["close"] > data["high"]:
-            print(f"❌ Close price ({data['close']}) must be within low-high range")
-            return False
-        
-        print("✅ data.json validation passed")
-        print(f"   Market data: Open=${data['open']:.2f}, High=${data['high']:.2f}, Low=${data['low']:.2f}, Close=${data['close']:.2f}")
+        _validated_market_data = {key: float(data[key]) for key in PRICE_KEYS}
+        emit("✅ data.json validation passed")
+        emit(f"   Market data: Open=${data['open']:.2f}, High=${data['high']:.2f}, Low=${data['low']:.2f}, Close=${data['close']:.2f}")
         return True
         
     except json.JSONDecodeError as e:
-        print(f"❌ Invalid JSON format in data.json: {e}")
+        emit(f"❌ Invalid JSON format in data.json: {e}")
         return False
     except Exception as e:
-        print(f"❌ Error validating data.json: {e}")
+        emit(f"❌ Error validating data.json: {e}")
         return False
 
 
 def check_main_script() -> bool:
     """Check if the main script exists and is executable."""
     script_file = Path("faketrading.py")
+    entry = _directory_entries().get(script_file.name)
     
-    if not script_file.exists():
-        print("❌ faketrading.py not found")
+    if entry is None:
+        emit("❌ faketrading.py not found")
         return False
     
     # Check if file is readable
-    if not os.access(script_file, os.R_OK):
-        print("❌ faketrading.py is not readable")
+    if not _is_readable(entry):
+        emit("❌ faketrading.py is not readable")
         return False
     
     # Try to make executable on Unix-like systems
     if os.name != 'nt':  # Not Windows
         try:
             os.chmod(script_file, 0o755)
-            print("✅ Made faketrading.py executable")
+            emit("✅ Made faketrading.py executable")
         except Exception as e:
-            print(f"⚠️  Could not make faketrading.py executable: {e}")
+            emit(f"⚠️  Could not make faketrading.py executable: {e}")
     
-    print("✅ faketrading.py found and ready")
+    emit("✅ faketrading.py found and ready")
     return True
 
 
 def check_test_suite() -> bool:
     """Check if test suite is available."""
-    test_file = Path("test_faketrading.py")
-    
-    if not test_file.exists():
-        print("⚠️  test_faketrading.py not found (tests will not be available)")
+    if "test_faketrading.py" not in _directory_entries():
+        emit("⚠️  test_faketrading.py not found (tests will not be available)")
         return True  # Not critical for basic setup
     
-    print("✅ Test suite available")
+    emit("✅ Test suite available")
     return True
 
 
 def check_makefile() -> bool:
     """Check if Makefile is available."""
-    makefile = Path("Makefile")
-    
-    if not makefile.exists():
-        print("⚠️  Makefile not found (make commands will not be available)")
+    if "Makefile" not in _directory_entries():
+        emit("⚠️  Makefile not found (make commands will not be available)")
         return True  # Not critical for basic setup
     
-    print("✅ Makefile available")
+    emit("✅ Makefile available")
     return True
 
 
 def run_quick_test() -> bool:
-    """Run a quick test to ensure the simulator works."""
+    """Run a quick test to ensure the simulator works, on the data validate_data_file accepted."""
+    market_data = _validated_market_data
+    if market_data is None:
+        emit("❌ Quick functionality test skipped: data.json did not validate")
+        return False
+    
     try:
-        # Import the simulator
+        # Import the simulator only when it is actually exercised
         from faketrading import PriceSimulator
         
         # Create simulator instance
         simulator = PriceSimulator()
         
-        # Load market data
-        market_data = simulator.load_market_data()
-        
         # Test price generation
         simulator.market_data = market_data
         simulator.current_price = market_data["open"]
@@ -165,14 +249,14 @@ def run_quick_test() -> bool:
         for i in range(1, 5):
             price = simulator.generate_price(i)
             if not (market_data["low"] <= price <= market_data["high"]):
-                print(f"❌ Generated price {price} outside bounds")
+                emit(f"❌ Generated price {price} outside bounds")
                 return False
         
-        print("✅ Quick functionality test passed")
+        emit("✅ Quick functionality test passed")
         return True
         
     except Exception as e:
-        print(f"❌ Quick functionality test failed: {e}")
+        emit(f"❌ Quick functionality test failed: {e}")
         return False
 
 
@@ -180,52 +264,52 @@ def create_output_directory() -> bool:
     """Create output directory if it doesn't exist."""
     output_dir = Path("output")
     
-    if not output_dir.exists():
+    if output_dir.name not in _directory_entries():
         try:
             output_dir.mkdir()
-            print("✅ Created output directory")
+            emit("✅ Created output directory")
         except Exception as e:
-            print(f"⚠️  Could not create output directory: {e}")
+            emit(f"⚠️  Could not create output directory: {e}")
             return True  # Not critical
     
     return True
 
 
-def check_permissions() -> bool:
-    """Check file permissions."""
-    files_to_check = ["faketrading.py", "data.json"]
-    
-    for file_path in files_to_check:
-        path = Path(file_path)
-        if path.exists():
-            if not os.access(path, os.R_OK):
-                print(f"❌ {file_path} is not readable")
-                return False
-    
-    print("✅ File permissions are correct")
-    return True
+def _run_check(check_func) -> Tuple[bool, List[str]]:
+    """Run one check, returning its result and the output it emitted."""
+    lines: List[str] = []
+    _local.output = lines
+    try:
+        passed = check_func()
+    finally:
+        del _local.output
+    return passed, lines
 
 
 def print_summary() -> None:
     """Print setup summary and next steps."""
-    print("\n" + "="*50)
-    print("SETUP SUMMARY")
-    print("="*50)
-    print("✅ Environment validation complete")
-    print("\nNext steps:")
-    print("1. Run the simulator: python faketrading.py")
-    print("2. Run tests: python test_faketrading.py")
-    print("3. Use make commands: make help")
-    print("\nFor more information, see:")
-    print("- README.MD (full documentation)")
-    print("- QUICKSTART.md (quick start guide)")
-    print("="*50)
-
-
-def main() -> int:
-    """Main setup function."""
-    print("🔧 Fake Trading Price Simulator Setup")
-    print("="*50)
+    emit("\n" + "="*50)
+    emit("SETUP SUMMARY")
+    emit("="*50)
+    emit("✅ Environment validation complete")
+    emit("\nNext steps:")
+    emit("1. Run the simulator: python faketrading.py")
+    emit("2. Run tests: python test_faketrading.py")
+    emit("3. Use make commands: make help")
+    emit("\nFor more information, see:")
+    emit("- README.MD (full documentation)")
+    emit("- QUICKSTART.md (quick start guide)")
+    emit("="*50)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Main setup function; --fast skips the simulator quick test."""
+    args = sys.argv[1:] if argv is None else argv
+    fast = "--fast" in args
+    
+    emit("🔧 Fake Trading Price Simulator Setup")
+    emit("="*50)
+    flush_output()
     
     checks = [
         ("Python Version", check_python_version),
@@ -234,22 +318,47 @@ def main() -> int:
         ("Main Script", check_main_script),
         ("Test Suite", check_test_suite),
         ("Makefile", check_makefile),
-        ("File Permissions", check_permissions),
         ("Output Directory", create_output_directory),
-        ("Quick Test", run_quick_test),
     ]
+    if not fast:
+        checks.append(("Quick Test", run_quick_test))
+    
+    # The quick test reuses the validated data, so that chain runs in order;
+    # every other check only touches the filesystem and runs in the pool
+    dependent = {"Data File", "Quick Test"}
+    
+    # Rescan once per run, before the threads share the snapshot
+    _directory_entries.cache_clear()
+    _directory_entries()
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        futures = {
+            name: pool.submit(_run_check, func)
+            for name, func in checks if name not in dependent
+        }
+        results = {
+            name: _run_check(func)
+            for name, func in checks if name in dependent
+        }
+        for name, future in futures.items():
+            results[name] = future.result()
     
     all_passed = True
-    for check_name, check_func in checks:
-        print(f"\n📋 {check_name}...")
-        if not check_func():
+    for check_name, _ in checks:
+        passed, lines = results[check_name]
+        emit(f"\n📋 {check_name}...")
+        _output.extend(lines)
+        # One write per check, in check order
+        flush_output()
+        if not passed:
             all_passed = False
     
     if all_passed:
         print_summary()
+        flush_output()
         return 0
     else:
-        print("\n❌ Setup failed. Please fix the issues above and run setup again.")
+        emit("\n❌ Setup failed. Please fix the issues above and run setup again.")
+        flush_output()
         return 1
 
 